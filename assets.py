@@ -0,0 +1,86 @@
+import typing
+import time
+import queue
+import threading
+import pygame
+import sounds
+import cache
+import utils
+import config
+
+# Cropped with a colorkey (see utils.crop_image), so they are kept in their file format
+raw_images = {config.images['circles'], config.images['splashes']}
+
+
+def get_manifest(extra_images: typing.Iterable[str] = ()) -> typing.Tuple[
+        typing.List[typing.Tuple[str, bool]], typing.Dict[str, str]]:
+    # Images with whether they are converted to the display format, and sounds by their names.
+    # Sprite sheets are left out when all their regions are in the asset cache's atlas, and so are the images
+    # the cache maps instead of loading them
+    skipped = cache.get_sheets() | cache.get_mapped()
+    names = [name for name in list(config.images.values()) + list(extra_images) if name not in skipped]
+    return [(name, name not in raw_images) for name in names], dict(config.sounds)
+
+
+# Decodes the manifest assets on a worker thread, the loading screen finishes them on the main thread (poll)
+class Loader:
+    def __init__(
+            self, images: typing.List[typing.Tuple[str, bool]], sounds_paths: typing.Dict[str, str],
+            bank: sounds.SoundBank
+    ):
+        self.images = images
+        self.sounds_paths = sounds_paths
+        self.bank = bank
+        self.tasks: typing.List[typing.Callable[[], None]] = []
+        self.decoded: queue.Queue = queue.Queue()
+        self.thread: typing.Optional[threading.Thread] = None
+        self.total = len(images) + len(sounds_paths)
+        self.done = 0
+
+    def add_task(self, task: typing.Callable[[], None]) -> None:
+        # Tasks run after every asset is finished, in the order they were added
+        self.tasks.append(task)
+        self.total += 1
+
+    def start(self) -> None:
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.decode, name='assets', daemon=True)
+            self.thread.start()
+
+    def decode(self) -> None:
+        try:
+            for name, convert in self.images:
+                self.decoded.put((self.finish_image, (name, convert), utils.decode_image(name)))
+            for name, path in self.sounds_paths.items():
+                self.decoded.put((self.finish_sound, name, pygame.mixer.Sound(path)))
+        except Exception as error:  # Raised again on the main thread by poll
+            self.decoded.put((None, None, error))
+
+    def finish_image(self, key: typing.Tuple[str, bool], image: pygame.Surface) -> None:
+        name, convert = key
+        utils.add_image(name, image, convert)
+
+    def finish_sound(self, name: str, sound: pygame.mixer.Sound) -> None:
+        self.bank.add(name, sound)
+
+    def poll(self, budget: float = config.loading_frame_budget) -> None:
+        self.start()
+        deadline = time.perf_counter() + budget
+        while not self.is_done() and time.perf_counter() < deadline:
+            if self.done < len(self.images) + len(self.sounds_paths):
+                try:
+                    finish, key, value = self.decoded.get(timeout=max(deadline - time.perf_counter(), 0))
+                except queue.Empty:
+                    return
+                if finish is None:
+                    raise value
+                finish(key, value)
+            else:
+                self.tasks[self.done - len(self.images) - len(self.sounds_paths)]()
+            self.done += 1
+
+    def get_progress(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    def is_done(self) -> bool:
+        return self.done == self.total
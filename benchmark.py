@@ -0,0 +1,318 @@
+import gc
+import sys
+import json
+import time
+import typing
+import platform
+import statistics
+import subprocess
+import tracemalloc
+import pygame
+import vendor.padlib.particles as particles
+import headless
+import managers
+import singletons
+import scheduler
+import screens
+import blades
+import fruits
+import physics
+import render
+import replay
+import sprites
+import config
+
+# Operation, timed, and an optional function run before every call of it, not timed
+Case = typing.Tuple[typing.Callable[[], None], typing.Optional[typing.Callable[[], None]]]
+
+counts = (100, 1000, 10000)
+fruits_classes = ('RedApple', 'GreenApple', 'Banana', 'Kiwi', 'Lemon', 'Lime', 'Orange', 'Pear')
+benchmarks: typing.List[typing.Tuple[str, typing.Tuple[str, ...], bool, typing.Callable[[str, int], Case]]] = []
+
+
+def benchmark(name: str, variants: typing.Tuple[str, ...] = ('',), scaled: bool = True):
+    # Registers a case builder, which is called with a variant and an entity count and sets the scene up
+    def register(function: typing.Callable[[str, int], Case]) -> typing.Callable[[str, int], Case]:
+        benchmarks.append((name, variants, scaled, function))
+        return function
+    return register
+
+
+def reset_scene(engine: str = 'numpy') -> None:
+    # Groups are created again, so that they pick the requested physics engine
+    config.physics_engine = engine
+    config.freeze_gravity = 0
+    for group in (
+            singletons.FruitsGroup, singletons.PartsGroup, singletons.BladesGroup, singletons.ScoresGroup,
+            singletons.LivesGroup, singletons.SplashesGroup
+    ):
+        if group.group is not None:
+            group.group.empty()
+        group.group = None
+    scheduler.rng.seed(0)
+
+
+def spawn_fruits(count: int, offscreen: bool = False) -> None:
+    # Spread over the screen (or under it, falling), the same layout on every run
+    group = singletons.FruitsGroup.get()
+    for i in range(len(group), len(group) + count):
+        fruit = getattr(fruits, fruits_classes[i % len(fruits_classes)]).create(False)
+        x = i * 97 % config.width
+        y = config.height + 200 if offscreen else i * 61 % config.height
+        fruit.move((x - fruit.rect.w // 2, y - fruit.rect.h // 2))
+        fruit.velocity = (i % 7 * 20 - 60, 300 if offscreen else -600)
+    group.interpolate(1.0)
+
+
+def refill_fruits(count: int, offscreen: bool = False) -> None:
+    missing = count - len(singletons.FruitsGroup.get())
+    if missing > 0:
+        spawn_fruits(missing, offscreen)
+
+
+def get_variants(engine_dependent: bool) -> typing.Tuple[str, ...]:
+    return ('numpy', 'python') if engine_dependent and physics.numpy is not None else ('python', )
+
+
+@benchmark('RotatingEntity.update', get_variants(True))
+def rotating_entity_update(variant: str, count: int) -> Case:
+    # With the numpy engine, the group steps all entities at once instead of calling update on each
+    reset_scene(variant)
+    spawn_fruits(count)
+    return singletons.FruitsGroup.get().update, None
+
+
+@benchmark('_BladesGroup.check_fruit_cut', ('full swipe', 'tick swipe'))
+def check_fruit_cut(variant: str, count: int) -> Case:
+    reset_scene()
+    spawn_fruits(count)
+    blade = blades.Blade()
+    blade.session_started = True
+    y = config.height // 2
+    track = [(0, y), (config.width, y)] if variant == 'full swipe' else [(620, y), (650, y + 10)]
+    blade.mouse_track[:] = track
+    # Fruits on the swipe line. Those cut by a call are spawned again where they were, so every call cuts them all
+    targets = blade.get_swept_fruits(singletons.FruitsGroup.get())
+    centers = [fruit.get_tick_center() for fruit in targets]
+
+    def before() -> None:
+        # The pool hands the cut fruits out again, so all of them are looked up first
+        for i in [i for i, fruit in enumerate(targets) if not fruit.alive()]:
+            targets[i] = fruit = type(targets[i]).create(False)
+            (x, y), (center_x, center_y) = centers[i], fruit.get_tick_center()
+            fruit.move((x - center_x, y - center_y))
+        for group in (singletons.PartsGroup, singletons.SplashesGroup, singletons.ScoresGroup):
+            group.get().empty()
+        blade.cut_fruits.clear()
+        blade.mouse_track[:] = track
+
+    return singletons.BladesGroup.get().check_fruit_cut, before
+
+
+@benchmark('_FruitsGroup.delete_invisible', get_variants(True))
+def delete_invisible(variant: str, count: int) -> Case:
+    # Half of the fruits have fallen under the screen and are deleted by every call
+    reset_scene(variant)
+    spawn_fruits(count // 2)
+
+    def before() -> None:
+        refill_fruits(count, True)
+
+    return singletons.FruitsGroup.get().delete_invisible, before
+
+
+def create_particles(variant: str, count: int):
+    system = particles.ParticlePool() if variant == 'ParticlePool' else particles.ParticleSystem()
+    emitter = blades.Blade().set_emitter()
+    emitter.set_position((config.width // 2, config.height // 2))
+    emitter.set_density(count)
+    emitter.set_life([1000.0, 1000.0])
+    system.set_particle_acceleration([0.0, 100.0])
+    system.add_emitter(emitter, 'emitter')
+    system.update(1.0)
+    # Only the particles created above are moved and drawn
+    emitter.set_density(0)
+    return system
+
+
+def get_particle_variants() -> typing.Tuple[str, ...]:
+    return ('ParticleSystem', 'ParticlePool') if particles.numpy is not None else ('ParticleSystem', )
+
+
+@benchmark('ParticleSystem.update', get_particle_variants())
+def particles_update(variant: str, count: int) -> Case:
+    system = create_particles(variant, count)
+    return lambda: system.update(1.0 / config.fps), None
+
+
+@benchmark('ParticleSystem.draw', get_particle_variants())
+def particles_draw(variant: str, count: int) -> Case:
+    system = create_particles(variant, count)
+    surface = pygame.display.get_surface()
+    return lambda: system.draw(surface), None
+
+
+@benchmark('Blade.get_max_combo')
+def get_max_combo(variant: str, count: int) -> Case:
+    reset_scene()
+    blade = blades.Blade()
+    # A zigzag, so both straight and curved parts of the track are found
+    blade.cut_fruits[:] = [(i * 10 % config.width, config.height // 2 + (i % 3) * 40) for i in range(count)]
+    return blade.get_max_combo, None
+
+
+@benchmark('HudText.draw', ('changed', 'unchanged'), False)
+def hud_text_draw(variant: str, count: int) -> Case:
+    text = sprites.HudText((20, 20))
+    surface = pygame.display.get_surface()
+    score = [0]
+
+    def draw() -> None:
+        if variant == 'changed':
+            score[0] += 1
+        text.set_text(f'Score: {score[0]}')
+        text.draw(surface)
+
+    return draw, None
+
+
+@benchmark('Classic.update_screen', ('flip', 'dirty'))
+def classic_update_screen(variant: str, count: int) -> Case:
+    # A whole rendered frame of the classic mode with the fruits and half as many parts
+    reset_scene()
+    classic = managers.ScreensManager.get_screen(screens.Classic)
+    classic.reload()
+    replay.stop(0)
+    spawn_fruits(count)
+    for i in range(count // 2):
+        fruits.RedApplePart.create((i * 53 % config.width, i * 29 % config.height))
+    surface = pygame.display.get_surface()
+    if variant == 'flip':
+        def frame() -> None:
+            classic.draw_background(surface)
+            classic.update_screen(surface)
+        return frame, None
+    renderer = render.get_renderer(surface)
+
+    def frame() -> None:
+        renderer.restore(classic)
+        classic.update_screen(renderer)
+        renderer.get_dirty()
+    return frame, None
+
+
+def measure(case: Case, repeat: int, budget: float) -> typing.Dict[str, float]:
+    operation, before = case
+    # Warm up the caches, then time until there are enough calls or the time budget is spent
+    if before:
+        before()
+    operation()
+    gc.collect()
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < repeat and (len(timings) < 5 or time.perf_counter() - started < budget):
+        if before:
+            before()
+        moment = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - moment)
+    # Allocations of Python objects and NumPy arrays, SDL surfaces are not traced
+    net, peak = [], []
+    tracemalloc.start()
+    for _ in range(3):
+        if before:
+            before()
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        operation()
+        after, highest = tracemalloc.get_traced_memory()
+        net.append(after - current)
+        peak.append(highest - current)
+    tracemalloc.stop()
+    return {
+        'calls': len(timings),
+        'mean_ms': statistics.mean(timings) * 1000,
+        'median_ms': statistics.median(timings) * 1000,
+        'min_ms': min(timings) * 1000,
+        'max_ms': max(timings) * 1000,
+        'stdev_ms': (statistics.stdev(timings) if len(timings) > 1 else 0.0) * 1000,
+        'alloc_net_bytes': int(statistics.mean(net)),
+        'alloc_peak_bytes': int(statistics.mean(peak)),
+    }
+
+
+def get_metadata() -> typing.Dict[str, typing.Any]:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': physics.numpy.__version__ if physics.numpy is not None else None,
+        'platform': platform.platform(),
+        'physics_engine': config.physics_engine,
+        'dirty_rendering': config.dirty_rendering,
+    }
+
+
+def run(
+        entity_counts: typing.Iterable[int] = counts, repeat: int = 50, budget: float = 1.0,
+        only: typing.Optional[str] = None
+) -> typing.Dict[str, typing.Any]:
+    headless.use_scratch_database()  # Reloaded screens save telemetry sessions
+    headless_runner = headless.Runner()
+    headless_runner.load()
+    metadata = get_metadata()
+    results = []
+    for name, variants, scaled, build in benchmarks:
+        if only and only not in name:
+            continue
+        for variant in variants:
+            for count in (entity_counts if scaled else (1, )):
+                result = {'name': name, 'variant': variant, 'count': count}
+                result.update(measure(build(variant, count), repeat, budget))
+                results.append(result)
+                print(
+                    f'{name:32} {variant:14} {count:6}  {result["median_ms"]:10.3f} ms  '
+                    f'{result["alloc_peak_bytes"] / 1024:10.1f} KiB peak', file=sys.stderr
+                )
+    reset_scene()
+    return {'metadata': metadata, 'results': results}
+
+
+def compare(base: typing.Dict[str, typing.Any], new: typing.Dict[str, typing.Any]) -> None:
+    # Median time of every benchmark that is in both runs, and how many times it changed
+    timings = {(r['name'], r['variant'], r['count']): r['median_ms'] for r in base['results']}
+    print(f'{base["metadata"]["commit"]} -> {new["metadata"]["commit"]}')
+    for result in new['results']:
+        key = result['name'], result['variant'], result['count']
+        if key in timings:
+            ratio = result['median_ms'] / timings[key] if timings[key] else float('inf')
+            print(
+                f'{key[0]:32} {key[1]:14} {key[2]:6}  {timings[key]:10.3f} -> {result["median_ms"]:10.3f} ms  '
+                f'x{ratio:.2f}'
+            )
+
+
+def main() -> None:
+    # python benchmark.py [output.json] [100,1000,10000] [name filter]
+    # python benchmark.py compare base.json new.json
+    if len(sys.argv) > 1 and sys.argv[1] == 'compare':
+        with open(sys.argv[2]) as base, open(sys.argv[3]) as new:
+            compare(json.load(base), json.load(new))
+        return
+    output = sys.argv[1] if len(sys.argv) > 1 else 'benchmark.json'
+    entity_counts = [int(count) for count in sys.argv[2].split(',')] if len(sys.argv) > 2 else counts
+    results = run(entity_counts, only=sys.argv[3] if len(sys.argv) > 3 else None)
+    with open(output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f'Results of {len(results["results"])} benchmarks written to {output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,14 @@
 import math
 import pygame
+import inputs
 import vendor.padlib.particles as particles
+import managers
 import singletons
 import sprites
 import config
 
+frame_time = 1.0 / config.fps  # In seconds, real time of the previous frame, set by Screen.loop
+
 
 class Blade(pygame.sprite.Sprite):
     def __init__(self, *groups):
@@ -30,13 +34,15 @@ class Blade(pygame.sprite.Sprite):
             self.check_combo()
         self.cut_fruits.clear()
         self.mouse_track.clear()
+        if value:
+            self.mouse_track.append(inputs.get_pos())
         self._session_started = value
 
     def check_combo(self):
         max_combo = self.get_max_combo()
         if max_combo >= 1:
-            sprites.CenteredFruitScore(f'Combo {max_combo + 2} fruits', max_combo * 2)
-            pygame.mixer.Sound(f'media/sounds/combo-{max_combo if max_combo <= 8 else 8}.ogg').play()
+            sprites.CenteredFruitScore.create(f'Combo {max_combo + 2} fruits', max_combo * 2)
+            managers.SoundsManager.get_instance().play(f'combo_{max_combo if max_combo <= 8 else 8}')
 
     def get_max_combo(self):
         curvatures = []
@@ -73,13 +79,46 @@ class Blade(pygame.sprite.Sprite):
             return 1
 
     def add_cut_fruit(self, fruit):
-        x, y = fruit.rect.x, fruit.rect.y
-        self.cut_fruits.append((x + fruit.rect.w // 2, y + fruit.rect.h // 2))
+        rect, mask = fruit.get_tick_frame()
+        self.cut_fruits.append((rect.x + rect.w // 2, rect.y + rect.h // 2))
         fruit.cut()
 
     def add_mouse_track_pos(self, pos):
         self.mouse_track.append(pos)
 
+    def get_segment(self):
+        if not self.mouse_track:
+            pos = inputs.get_pos()
+            return pos, pos
+        return self.mouse_track[-2] if len(self.mouse_track) > 1 else self.mouse_track[-1], self.mouse_track[-1]
+
+    def get_swept_fruits(self, fruits):
+        # Blade is swept along the last segment of the mouse track, so fast swipes don't skip fruits
+        (x1, y1), (x2, y2) = self.get_segment()
+        w, h = self.rect.size
+        bounds = pygame.Rect(min(x1, x2), min(y1, y2), abs(x2 - x1) + w, abs(y2 - y1) + h)
+        candidates = fruits.query(bounds)
+        if not candidates:
+            return []
+        segment_mask = pygame.mask.Mask(bounds.size)
+        steps = max(abs(x2 - x1), abs(y2 - y1))
+        for i in range(steps + 1):
+            t = i / steps if steps else 0
+            segment_mask.draw(self.mask, (round(x1 + (x2 - x1) * t) - bounds.x, round(y1 + (y2 - y1) * t) - bounds.y))
+        # Against the fruits as they are at this tick, not as they were last drawn, which depends on the frame rate
+        cut = []
+        for fruit in candidates:
+            rect, mask = fruit.get_tick_frame()
+            if mask.overlap(segment_mask, (bounds.x - rect.x, bounds.y - rect.y)):
+                cut.append((rect, fruit))
+        # Fruits are cut in the order the blade reaches them, then in their order on screen and of spawning, so that
+        # the order never depends on the set the candidates come from (replays must cut in the same order)
+        cut.sort(key=lambda item: (
+            (item[0].centerx - x1) * (x2 - x1) + (item[0].centery - y1) * (y2 - y1),
+            item[0].y, item[0].x, item[1].serial
+        ))
+        return [fruit for rect, fruit in cut]
+
     def set_emitter(self):
         emitter = particles.Emitter()
         emitter.set_density(100)
@@ -90,18 +129,19 @@ class Blade(pygame.sprite.Sprite):
         return emitter
 
     def set_particle_system(self):
-        particle_system = particles.ParticleSystem()
+        particle_system = particles.ParticlePool() if particles.numpy is not None else particles.ParticleSystem()
         particle_system.set_particle_acceleration([0.0, 100.0])
         particle_system.add_emitter(self.emitter, "emitter")
         return particle_system
 
     def create_particles(self, surface):
-        self.emitter.set_position((self.rect.x, self.rect.y) if pygame.mouse.get_pressed()[0] else (9999, 9999))
+        self.emitter.set_position((self.rect.x, self.rect.y) if inputs.get_pressed()[0] else (9999, 9999))
         self.particle_system.draw(surface)
-        self.particle_system.update(1.0 / config.fps)
+        # Particles are only drawn, so they move with the real time between frames rather than with ticks
+        self.particle_system.update(frame_time)
 
     def update(self, *args):
-        self.rect.x, self.rect.y = pygame.mouse.get_pos()
+        self.rect.x, self.rect.y = inputs.get_pos()
         self.create_particles(args[0])
         if self.session_started:
             args[0].blit(self.image, self.rect)
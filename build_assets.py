@@ -0,0 +1,124 @@
+import os
+import sys
+import json
+import time
+import typing
+import pygame
+import screens
+import fruits
+import sprites
+import assets
+import cache
+import utils
+import config
+
+Region = typing.Tuple[str, pygame.Rect, bool]  # Source image, rect in it, whether the source is converted
+
+
+def get_regions() -> typing.List[Region]:
+    # Every region the game crops from a sprite sheet (the sprite_rect tables)
+    regions = [
+        (config.images['fruits'], fruit_class.sprite_rect, True) for fruit_class in fruits.Fruit.__subclasses__()
+    ]
+    for part_class in fruits.Part.__subclasses__():
+        regions += [(config.images['parts'], rect, True) for rect in part_class.sprite_rect]
+    regions += [(config.images['splashes'], rect, False) for rect in sprites.Splash.sprite_rect]
+    regions += [(config.images['lives'], rect, True) for rect in sprites.Life.sprite_rect.values()]
+    regions += [(config.images['circles'], rect, False) for rect in screens.MainMenu.circles_rect.values()]
+    return regions
+
+
+def get_sizes() -> typing.Dict[str, typing.Tuple[int, int]]:
+    # Images the game only uses scaled to one size are stored at that size
+    sizes = {screen.get_image_path(): (config.width, config.height) for screen in get_screens()}
+    sizes[config.images['fruit_label']] = screens.MainMenu.logo_part_size
+    sizes[config.images['mania_label']] = screens.MainMenu.logo_part_size
+    return sizes
+
+
+def get_screens() -> typing.List[typing.Type[screens.Screen]]:
+    return [screen for screen in screens.Screen.__subclasses__() if screen is not screens.Quit]
+
+
+def pack(
+        sizes: typing.List[typing.Tuple[int, int]], width: int
+) -> typing.Tuple[typing.List[typing.Tuple[int, int]], int]:
+    # Shelf packing, the tallest regions first: returns the position of every size and the height of the atlas
+    positions: typing.List[typing.Tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = shelf = 0
+    for i in sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True):
+        w, h = sizes[i]
+        if x + w > width:
+            x, y, shelf = 0, y + shelf, 0
+        positions[i] = x, y
+        x += w + 1  # A black pixel between the regions, which is transparent like their background
+        shelf = max(shelf, h + 1)
+    return positions, y + shelf
+
+
+def build() -> None:
+    # The sources are read as the game reads them without a cache
+    cache.index = {}
+    os.makedirs(config.asset_cache, exist_ok=True)
+    regions = get_regions()
+    sheets = sorted({name for name, rect, convert in regions})
+    sizes = get_sizes()
+    backgrounds = [screen.get_image_path() for screen in get_screens()]
+    images, _ = assets.get_manifest(backgrounds)
+    files, mapped = {}, {}
+    for name, convert in images:
+        if name in sheets:
+            continue
+        image = utils.load_image(name, convert)
+        if name in sizes:
+            image = pygame.transform.scale(image, sizes[name])
+        file_name = name.replace('/', '_').rsplit('.', 1)[0] + '.raw'
+        if name in backgrounds:
+            # Drawn over black as Screen.draw_background does, in the byte order of a 32 bit display
+            background = pygame.Surface(image.get_size()).convert()
+            background.fill((0, 0, 0))
+            background.blit(image, (0, 0))
+            mapped[name] = file_name
+            cache.save_raw(cache.get_path(file_name), background, 'BGRA')
+        else:
+            files[name] = file_name
+            cache.save_raw(cache.get_path(file_name), image)
+    cropped = [utils.crop_image(utils.load_image(name, convert), rect) for name, rect, convert in regions]
+    positions, height = pack([image.get_size() for image in cropped], config.asset_atlas_width)
+    atlas = pygame.Surface((config.asset_atlas_width, height)).convert()
+    atlas.fill((0, 0, 0))
+    for image, position in zip(cropped, positions):
+        image.set_colorkey(None)  # Copied as it is, the colorkey is set again on the regions taken from the atlas
+        atlas.blit(image, position)
+    cache.save_raw(cache.get_path('atlas.raw'), atlas, 'RGB')
+    with open(cache.get_path('index.json'), 'w') as file:
+        json.dump({
+            'version': cache.VERSION,
+            'size': [config.width, config.height],
+            'sources': {name: cache.get_checksum(name) for name in sorted(set(files) | set(mapped) | set(sheets))},
+            'images': files,
+            'mapped': mapped,
+            'sheets': sheets,
+            'regions': {
+                cache.get_region_key(name, rect, convert): list(position)
+                for (name, rect, convert), position in zip(regions, positions)
+            },
+        }, file, indent=1)
+
+
+def main() -> None:
+    # python build_assets.py: run after changing the images, the game uses the sources while the cache is out of date
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    utils.init()
+    started = time.perf_counter()
+    build()
+    size = sum(os.path.getsize(cache.get_path(name)) for name in os.listdir(config.asset_cache))
+    print(
+        f'Asset cache built in {config.asset_cache} in {time.perf_counter() - started:.2f} s, {size / 2 ** 20:.1f} MiB',
+        file=sys.stderr
+    )
+
+
+if __name__ == '__main__':
+    main()
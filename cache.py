@@ -0,0 +1,124 @@
+import os
+import json
+import mmap
+import zlib
+import struct
+import typing
+import pygame
+import surfaces
+import config
+
+MAGIC = b'FMRC'
+VERSION = 2
+HEADER = struct.Struct('<4sBHH4s')  # Magic, version, width, height, pixel format (as pygame.image.tobytes names it)
+
+index: typing.Optional[typing.Dict[str, typing.Any]] = None  # Read on first use, empty when the cache is not valid
+atlas: typing.Optional[pygame.Surface] = None
+mappings: typing.Dict[str, mmap.mmap] = {}  # Mapped images by their names, see map_image
+
+
+def get_path(name: str) -> str:
+    return os.path.join(config.asset_cache, name)
+
+
+def get_checksum(name: str) -> int:
+    # Of the source image, so the cache is left out as soon as an image is edited, whatever its mtime says
+    with open(os.path.join('media/images', name), 'rb') as file:
+        return zlib.crc32(file.read())
+
+
+def save_raw(path: str, surface: pygame.Surface, pixel_format: str = 'RGBA') -> None:
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, *surface.get_size(), pixel_format.encode().ljust(4, b'\0')))
+        file.write(pygame.image.tobytes(surface, pixel_format))
+
+
+def map_raw(path: str) -> typing.Tuple[pygame.Surface, mmap.mmap]:
+    # No decoding and no copy: the pixels of the surface are the pages of the file, mapped read only.
+    # The mapping lives as long as the surface does
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, width, height, pixel_format = HEADER.unpack_from(mapping)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'{path} is not a raw image of this version of the game')
+    surface = pygame.image.frombuffer(
+        memoryview(mapping)[HEADER.size:], (width, height), pixel_format.rstrip(b'\0').decode()
+    )
+    return surface, mapping
+
+
+def load_raw(path: str) -> pygame.Surface:
+    return map_raw(path)[0]
+
+
+def read_index() -> typing.Dict[str, typing.Any]:
+    try:
+        with open(get_path('index.json')) as file:
+            data = json.load(file)
+        if data['version'] != VERSION or data['size'] != [config.width, config.height]:
+            return {}
+        if any(get_checksum(name) != checksum for name, checksum in data['sources'].items()):
+            return {}
+    except (OSError, ValueError, KeyError):
+        return {}
+    return data
+
+
+def get_index() -> typing.Dict[str, typing.Any]:
+    global index
+    if index is None:
+        index = read_index()
+    return index
+
+
+def get_sheets() -> typing.Set[str]:
+    # Images that are only used through their regions, which are all in the atlas
+    return set(get_index().get('sheets', ()))
+
+
+def get_mapped() -> typing.Set[str]:
+    # Images that are drawn from their mapping as they are, without being loaded (see map_image)
+    return set(get_index().get('mapped', ()))
+
+
+def map_image(name: str) -> typing.Optional[pygame.Surface]:
+    # Stored opaque in the pixel layout of the display, so blitting it needs no conversion, and only the pages
+    # of the file that are drawn become resident. None when it is not cached
+    files = get_index().get('mapped', {})
+    if name not in files:
+        return None
+    image, mappings[name] = map_raw(get_path(files[name]))
+    image.set_alpha(None)  # Stored with an opaque alpha channel, which is not blended
+    return image
+
+
+def evict(name: str) -> None:
+    # Drops the resident pages of a mapped image, they are read again from the file (or the page cache) when it is
+    # drawn again. The mapping and the surface stay valid
+    if name in mappings and hasattr(mmap, 'MADV_DONTNEED'):  # Not on Windows
+        mappings[name].madvise(mmap.MADV_DONTNEED)
+
+
+def load_image(name: str) -> typing.Optional[pygame.Surface]:
+    # Decoded, and already scaled when the game uses it at one size only. None when it is not cached
+    files = get_index().get('images', {})
+    return load_raw(get_path(files[name])) if name in files else None
+
+
+def get_region_key(name: str, rect: pygame.Rect, convert: bool) -> str:
+    return f'{name}|{int(convert)}|{rect.x},{rect.y},{rect.w},{rect.h}'
+
+
+def get_region(
+        name: str, rect: pygame.Rect, convert: bool = True, kind: str = surfaces.COLORKEY
+) -> typing.Optional[pygame.Surface]:
+    # Same as utils.crop_image of the region, copied from the packed atlas. None when it is not cached
+    global atlas
+    regions = get_index().get('regions', {})
+    key = get_region_key(name, rect, convert)
+    if key not in regions:
+        return None
+    if atlas is None:
+        atlas = load_raw(get_path('atlas.raw')).convert()
+    x, y = regions[key]
+    return surfaces.prepare(atlas.subsurface((x, y, rect.w, rect.h)).copy(), kind)
@@ -1,4 +1,6 @@
-fps = 60
+fps = 60  # Rendered frames per second cap, the game itself runs at tick_rate
+tick_rate = 60  # Simulation ticks per second
+max_frame_time = 0.25  # In seconds, longer frames are simulated as this long
 width = 1280
 height = 720
 gravity = 10
@@ -8,6 +10,37 @@ arcade_time = 90
 arcade_freeze_time = 5000  # In milliseconds
 arcade_blitz_time = 7000  # In milliseconds
 arcade_double_time = 7000  # In milliseconds
+rotation_steps = 60  # Most pre-rendered angles per rotating fruit or part
+# In bytes, shared by the rotated frames and masks of all fruits and parts, 6.6 MiB per step (2.0 MiB of fruits,
+# 4.6 MiB of parts): 38 steps of 9.5 degrees. The most, 60 steps, takes 400 MiB
+rotation_memory = 256 * 2 ** 20
+spinner_steps = 120  # Most rotated frames cached for one revolution of a sprites.Spinner
+# In bytes, shared by the frames of all spinners. The 3 menu circles take 0.84 MB per step: 39 steps of 9.2 degrees
+spinner_memory = 32 * 2 ** 20
+physics_engine = 'numpy'  # 'numpy' steps fruits and parts in batches, 'python' steps them one by one
+physics_capacity = 256  # Initial number of entities per physics engine, grows on demand
+dirty_rendering = True  # Redraw and update only the changed areas of the screen instead of whole frames
+dirty_rects_limit = 64  # More changed areas than this are updated as their bounding rect
+headless = False  # Set by headless.Runner: frames are drawn but not sent to the display
+spatial_cell_size = 128  # In pixels, cell size of the sprite groups' spatial index
+text_cache_size = 256  # Rendered text surfaces kept by utils.render_text
+fade_time = 2.125  # In seconds, splashes and score popups fade out over it
+fade_steps = 64  # Alpha levels of a fading image, see sprites.FadeFrames
+pool_size = 64  # Killed fruits, parts, splashes and score popups kept per class for reuse
+record_sessions = False  # Save the input of every finished game session for replays
+recordings_path = 'recordings'
+frame_profiler = False  # Time the phases of every frame and show them in an overlay, toggled in game with F3
+profiler_frames = 300  # Frames the profiler's percentiles are taken over
+profiler_refresh = 15  # Frames between updates of the profiler's overlay
+profiler_font_size = 20
+frame_budget = 1 / 60  # In seconds, frames that take longer to do are counted as slow by the session telemetry
+session_telemetry = True  # Store the frame times of every game session in the database (see telemetry.py)
+telemetry_worst_frames = 10  # Slowest frames stored per session, with their phases
+telemetry_burst = 3  # Fruits spawned in one frame that are stored as a spawn burst
+asset_cache = 'media/cache'  # Built by build_assets.py: raw, pre-scaled images and the atlas of the sprite sheets
+asset_atlas_width = 2048
+surface_report = True  # Print the loaded images that are blitted on a slow path when loading ends
+loading_frame_budget = 0.008  # In seconds, main thread time per frame spent on finishing loaded assets
 game_name = 'Fruit Mania'
 
 # Resources
@@ -28,6 +61,36 @@ sounds = {
     'combo_blitz': 'media/sounds/combo-blitz.ogg',
     'combo_blitz_end': 'media/sounds/combo-blitz-end.ogg',
     'double': 'media/sounds/double.ogg',
+    'combo_1': 'media/sounds/combo-1.ogg',
+    'combo_2': 'media/sounds/combo-2.ogg',
+    'combo_3': 'media/sounds/combo-3.ogg',
+    'combo_4': 'media/sounds/combo-4.ogg',
+    'combo_5': 'media/sounds/combo-5.ogg',
+    'combo_6': 'media/sounds/combo-6.ogg',
+    'combo_7': 'media/sounds/combo-7.ogg',
+    'combo_8': 'media/sounds/combo-8.ogg',
+}
+sound_channels = 16
+sound_priorities = {  # Sounds not listed here have priority 0 and are the first to be dropped
+    'music': 3,
+    'game_start': 2,
+    'game_over': 2,
+    'lose_life': 2,
+    'critical': 2,
+    'bomb_explode': 2,
+    'combo_blitz': 2,
+    'combo_blitz_end': 2,
+    'double': 2,
+    'combo_1': 2,
+    'combo_2': 2,
+    'combo_3': 2,
+    'combo_4': 2,
+    'combo_5': 2,
+    'combo_6': 2,
+    'combo_7': 2,
+    'combo_8': 2,
+    'fruit_cut': 1,
+    'fruit_impact': 1,
 }
 images = {
     'fruit_label': 'screens/main_menu/label_fruit.png',
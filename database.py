@@ -1,21 +1,180 @@
+import sys
+import queue
+import atexit
+import typing
 import sqlite3
+import threading
+import traceback
 import config
 
 
+# Runs the writes in order on a thread of its own, an error of a write is raised by the next call
+class Writer:
+    def __init__(self, path: str):
+        self.path = path
+        self.writes: queue.Queue = queue.Queue()
+        self.error: typing.Optional[Exception] = None
+        self.thread = threading.Thread(target=self.run, name='database', daemon=True)
+        self.thread.start()
+        # Queued writes are not lost when the game quits without closing the database
+        atexit.register(self.close)
+
+    def run(self) -> None:
+        connection = sqlite3.connect(self.path)
+        while True:
+            write = self.writes.get()
+            batch = [write]
+            while not self.writes.empty():
+                batch.append(self.writes.get())
+            try:
+                for write in batch:
+                    if write is not None:
+                        write[0](connection, *write[1])
+                connection.commit()
+            except Exception as error:
+                traceback.print_exc(file=sys.stderr)
+                self.error = error
+                connection.rollback()
+            finally:
+                for _ in batch:
+                    self.writes.task_done()
+            if None in batch:
+                connection.close()
+                return
+
+    def check(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def submit(self, write: typing.Callable[..., None], *args) -> None:
+        self.check()
+        self.writes.put((write, args))
+
+    def flush(self) -> None:
+        # Waits until everything submitted so far is written
+        self.writes.join()
+        self.check()
+
+    def close(self) -> None:
+        if self.thread.is_alive():
+            self.writes.put(None)
+            self.thread.join()
+        self.check()
+
+
 class Database:
     def __init__(self):
         self.connection: sqlite3.Connection = sqlite3.connect(config.database)
+        self.connection.row_factory = sqlite3.Row
         self.cursor: sqlite3.Cursor = self.connection.cursor()
+        # Readers do not wait for the writer thread, and a commit does not rewrite the database file
+        self.cursor.execute('PRAGMA journal_mode=WAL')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS scores_mode_score ON scores (mode, score)')
+        self.create_telemetry_tables()
+        self.connection.commit()
+        self.best_scores: typing.Dict[int, int] = {}  # Mode -> best score, read once and kept up to date
+        self.writer = Writer(config.database)
+
+    def create_telemetry_tables(self) -> None:
+        # Performance of game sessions, see telemetry.Session
+        self.cursor.executescript('''
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT UNIQUE NOT NULL, mode INTEGER NOT NULL, started TEXT NOT NULL,
+                seconds REAL NOT NULL, frames INTEGER NOT NULL, slow_frames INTEGER NOT NULL, score INTEGER NOT NULL,
+                machine TEXT, platform TEXT, physics_engine TEXT, dirty_rendering INTEGER,
+                peak_fruits INTEGER NOT NULL, peak_parts INTEGER NOT NULL, peak_particles INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS session_histogram (
+                session INTEGER NOT NULL REFERENCES sessions (id), bound REAL, frames INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS session_phases (
+                session INTEGER NOT NULL REFERENCES sessions (id), phase TEXT NOT NULL,
+                total REAL NOT NULL, max REAL NOT NULL, slow REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS session_worst_frames (
+                session INTEGER NOT NULL REFERENCES sessions (id), at REAL NOT NULL, time REAL NOT NULL,
+                phases TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS session_bursts (
+                session INTEGER NOT NULL REFERENCES sessions (id), at REAL NOT NULL, fruits INTEGER NOT NULL
+            );
+        ''')
 
     def get_best_score(self, mode) -> int:
-        score = self.cursor.execute('SELECT MAX(score) FROM scores WHERE mode=?', (mode, )).fetchone()[0]
-        if score is None:
-            score = 0
-        return score
+        if mode not in self.best_scores:
+            score = self.cursor.execute('SELECT MAX(score) FROM scores WHERE mode=?', (mode, )).fetchone()[0]
+            if score is None:
+                score = 0
+            self.best_scores[mode] = score
+        return self.best_scores[mode]
 
     def add_score(self, score, mode) -> None:
-        self.cursor.execute('INSERT INTO scores (score, mode) VALUES (?, ?)', (score, mode))
-        self.connection.commit()
+        # Written behind, the cached best score is updated instead of being read again before the write is done
+        if mode in self.best_scores:
+            self.best_scores[mode] = max(self.best_scores[mode], score)
+        self.writer.submit(self.insert_score, score, mode)
+
+    @staticmethod
+    def insert_score(connection: sqlite3.Connection, score, mode) -> None:
+        connection.execute('INSERT INTO scores (score, mode) VALUES (?, ?)', (score, mode))
+
+    def add_session(
+            self, session: typing.Dict[str, typing.Any], histogram: typing.List[tuple], phases: typing.List[tuple],
+            worst_frames: typing.List[tuple], bursts: typing.List[tuple]
+    ) -> None:
+        self.writer.submit(self.insert_session, session, histogram, phases, worst_frames, bursts)
+
+    @staticmethod
+    def insert_session(
+            connection: sqlite3.Connection, session: typing.Dict[str, typing.Any], histogram: typing.List[tuple],
+            phases: typing.List[tuple], worst_frames: typing.List[tuple], bursts: typing.List[tuple]
+    ) -> None:
+        cursor = connection.execute(
+            f'INSERT INTO sessions ({", ".join(session)}) VALUES ({", ".join("?" * len(session))})',
+            tuple(session.values())
+        )
+        session_id = cursor.lastrowid
+        connection.executemany(
+            'INSERT INTO session_histogram VALUES (?, ?, ?)', [(session_id, *row) for row in histogram]
+        )
+        connection.executemany(
+            'INSERT INTO session_phases VALUES (?, ?, ?, ?, ?)', [(session_id, *row) for row in phases]
+        )
+        connection.executemany(
+            'INSERT INTO session_worst_frames VALUES (?, ?, ?, ?)', [(session_id, *row) for row in worst_frames]
+        )
+        connection.executemany('INSERT INTO session_bursts VALUES (?, ?, ?)', [(session_id, *row) for row in bursts])
+
+    def get_sessions(self, mode=None) -> typing.List[sqlite3.Row]:
+        if mode is None:
+            return self.cursor.execute('SELECT * FROM sessions ORDER BY id').fetchall()
+        return self.cursor.execute('SELECT * FROM sessions WHERE mode=? ORDER BY id', (mode, )).fetchall()
+
+    def get_session(self, session_id) -> typing.Optional[sqlite3.Row]:
+        return self.cursor.execute('SELECT * FROM sessions WHERE id=?', (session_id, )).fetchone()
+
+    def get_session_histogram(self, session_id) -> typing.List[sqlite3.Row]:
+        return self.cursor.execute(
+            'SELECT bound, frames FROM session_histogram WHERE session=? ORDER BY rowid', (session_id, )
+        ).fetchall()
+
+    def get_session_phases(self, session_id) -> typing.List[sqlite3.Row]:
+        return self.cursor.execute(
+            'SELECT phase, total, max, slow FROM session_phases WHERE session=? ORDER BY slow DESC, total DESC',
+            (session_id, )
+        ).fetchall()
+
+    def get_session_worst_frames(self, session_id) -> typing.List[sqlite3.Row]:
+        return self.cursor.execute(
+            'SELECT at, time, phases FROM session_worst_frames WHERE session=? ORDER BY time DESC', (session_id, )
+        ).fetchall()
+
+    def get_session_bursts(self, session_id) -> typing.List[sqlite3.Row]:
+        return self.cursor.execute(
+            'SELECT at, fruits FROM session_bursts WHERE session=? ORDER BY at', (session_id, )
+        ).fetchall()
 
     def close(self) -> None:
+        self.writer.close()
         self.connection.close()
@@ -0,0 +1,40 @@
+import typing
+import pygame
+import surfaces
+import config
+
+
+# Full-screen color overlays, composited into one prebuilt surface
+class ScreenEffects:
+    def __init__(self, size: typing.Tuple[int, int] = (config.width, config.height)):
+        self.surface = pygame.Surface(size).convert()
+        self.layers: typing.Dict[str, typing.List] = {}
+        self.color = None
+
+    def add(self, name: str, color: typing.Tuple[int, int, int]) -> None:
+        # Layers are composited in the order they were added
+        self.layers[name] = [color, 0]
+
+    def set_alpha(self, name: str, alpha: int) -> None:
+        self.layers[name][1] = max(0, min(alpha, 255))
+
+    def get_composite(self) -> typing.Tuple[typing.Tuple[int, int, int], int]:
+        # Blending uniform layers one over another equals blending one layer of this color and alpha
+        red, green, blue, opacity = 0.0, 0.0, 0.0, 0.0
+        for (r, g, b), alpha in self.layers.values():
+            a = alpha / 255.0
+            red, green, blue = r * a + red * (1 - a), g * a + green * (1 - a), b * a + blue * (1 - a)
+            opacity = a + opacity * (1 - a)
+        if not opacity:
+            return (0, 0, 0), 0
+        return (round(red / opacity), round(green / opacity), round(blue / opacity)), round(opacity * 255)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        color, alpha = self.get_composite()
+        if not alpha:
+            return
+        if color != self.color:
+            self.surface.fill(color)
+            self.color = color
+        surfaces.set_alpha(self.surface, alpha)
+        screen.blit(self.surface, (0, 0))
@@ -1,40 +1,44 @@
 import sys
-import random
+import typing
 import pygame
+import inputs
 import managers
 import singletons
 import screens
 import objects
+import pools
+import scheduler
 import sprites
 import utils
 import config
 
 
-class Fruit(objects.RotatingEntity):
-    def __init__(self, throw_sound=True, *groups):
-        super().__init__(singletons.FruitsGroup.get(), *groups)
+class Fruit(pools.Poolable, objects.RotatingEntity):
+    def reset(self, throw_sound=True, *groups):
+        super().reset(singletons.FruitsGroup.get(), *groups)
         self.part_class = self.__class__.__name__ + 'Part'
         self._score = 5
-        self.sound_throw = pygame.mixer.Sound(config.sounds['fruit_throw'])
-        self.sound_cut = pygame.mixer.Sound(config.sounds['fruit_cut'])
+        self.screen = None
+        self.sound_throw = 'fruit_throw'
+        self.sound_cut = 'fruit_cut'
         if throw_sound:
-            self.sound_throw.play()
+            managers.SoundsManager.get_instance().play(self.sound_throw)
 
     def cut(self):
-        x, y = self.rect.x, self.rect.y
+        x, y = self.get_tick_frame()[0].topleft
         x_vel, y_vel = self.velocity
         part_class = getattr(sys.modules[self.__module__], self.part_class)
-        part_class((x, y), singletons.PartsGroup().get()).velocity = (
-            x_vel - random.randrange(200),
-            y_vel - random.randrange(-50, 50)
+        part_class.create((x, y)).velocity = (
+            x_vel - scheduler.rng.randrange(200),
+            y_vel - scheduler.rng.randrange(-50, 50)
         )
-        part_class((x, y), singletons.PartsGroup().get()).velocity = (
-            x_vel + random.randrange(200),
-            y_vel - random.randrange(-50, 50)
+        part_class.create((x, y)).velocity = (
+            x_vel + scheduler.rng.randrange(200),
+            y_vel - scheduler.rng.randrange(-50, 50)
         )
-        sprites.MouseFruitScore('Fruit', self.score)
-        sprites.Splash((x, y))
-        self.sound_cut.play()
+        sprites.MouseFruitScore.create('Fruit', self.score)
+        sprites.Splash.create((x, y))
+        managers.SoundsManager.get_instance().play(self.sound_cut)
         self.kill()
 
     @property
@@ -44,31 +48,45 @@ class Fruit(objects.RotatingEntity):
     @classmethod
     def get_image(cls):
         if not cls.image:
-            cls.image = utils.crop_image(utils.load_image(config.images['fruits']), cls.sprite_rect)
+            cls.image = utils.load_region(config.images['fruits'], cls.sprite_rect)
         return cls.image
 
+    @classmethod
+    def get_rotation_steps(cls) -> int:
+        return get_rotation_steps()
+
+    @classmethod
+    def preload(cls) -> None:
+        if cls.__name__ not in objects.RotatingEntity.atlases:
+            objects.RotatingEntity.atlases[cls.__name__] = objects.RotationAtlas(
+                cls.get_image(), cls.get_rotation_steps(), cls.__name__
+            )
+        objects.RotatingEntity.atlases[cls.__name__].build()
+
 
 class Bomb(Fruit):
     sprite_rect = pygame.Rect(0, 0, 142, 170)
 
-    def __init__(self, throw_sound=True, *groups):
-        super().__init__(throw_sound, *groups)
+    def reset(self, throw_sound=True, *groups):
+        self.channel_use = None
+        super().reset(throw_sound, *groups)
         self._score = -10
-        self.sound_throw = pygame.mixer.Sound(config.sounds['bomb_throw'])
-        self.sound_cut = pygame.mixer.Sound(config.sounds['bomb_explode'])
-        self.sound_use = pygame.mixer.Sound(config.sounds['bomb_use'])
+        self.sound_throw = 'bomb_throw'
+        self.sound_cut = 'bomb_explode'
+        self.sound_use = 'bomb_use'
         if throw_sound:
-            self.sound_use.set_volume(0.1)
-            self.sound_use.play()
-            self.sound_throw.play()
+            self.channel_use = managers.SoundsManager.get_instance().play(self.sound_use, volume=0.1)
+            managers.SoundsManager.get_instance().play(self.sound_throw)
 
     def cut(self):
-        sprites.FruitScore('Bomb', self.score, pygame.mouse.get_pos())
-        self.sound_cut.play()
+        sprites.FruitScore.create('Bomb', self.score, inputs.get_pos())
+        managers.SoundsManager.get_instance().play(self.sound_cut)
         self.kill()
 
     def kill(self):
-        self.sound_use.stop()
+        if self.channel_use:
+            managers.SoundsManager.get_instance().stop(self.sound_use, self.channel_use)
+            self.channel_use = None
         super().kill()
 
 
@@ -124,8 +142,9 @@ class Starfruit(Fruit):
     sprite_rect = pygame.Rect(194, 358, 128, 133)
 
     def cut(self):
-        managers.ScreensManager.get_screen(screens.Arcade).set_double(True)
-        pygame.time.set_timer(screens.Arcade.event_stop_double, config.arcade_double_time)
+        arcade = managers.ScreensManager.get_screen(screens.Arcade)
+        arcade.set_double(True)
+        arcade.scheduler.set_timer(screens.Arcade.event_stop_double, config.arcade_double_time)
         super().cut()
 
 
@@ -137,8 +156,9 @@ class Garnet(Fruit):
     sprite_rect = pygame.Rect(508, 353, 173, 150)
 
     def cut(self):
-        managers.ScreensManager.get_screen(screens.Arcade).set_blitz(True)
-        pygame.time.set_timer(screens.Arcade.event_stop_blitz, config.arcade_blitz_time)
+        arcade = managers.ScreensManager.get_screen(screens.Arcade)
+        arcade.set_blitz(True)
+        arcade.scheduler.set_timer(screens.Arcade.event_stop_blitz, config.arcade_blitz_time)
         super().cut()
 
 
@@ -146,30 +166,37 @@ class FrozenApple(Fruit):
     sprite_rect = pygame.Rect(680, 353, 172, 145)
 
     def cut(self):
-        managers.ScreensManager.get_screen(screens.Arcade).set_freeze(True)
-        pygame.time.set_timer(screens.Arcade.event_remove_freeze, config.arcade_freeze_time)
+        arcade = managers.ScreensManager.get_screen(screens.Arcade)
+        arcade.set_freeze(True)
+        arcade.scheduler.set_timer(screens.Arcade.event_remove_freeze, config.arcade_freeze_time)
         super().cut()
 
 
-class Part(objects.RotatingEntity):
-    base_image: pygame.Surface = 0
+class Part(pools.Poolable, objects.RotatingEntity):
     sprite_rect = []
+    cropped_images: typing.Dict[typing.Tuple[str, int], pygame.Surface] = {}
 
-    def __init__(self, pos, *groups):
-        self.original_image = 0
-        super().__init__(singletons.PartsGroup.get(), *groups)
+    def reset(self, pos, *groups):
+        self.sprite_index = scheduler.rng.randrange(len(self.sprite_rect))
+        super().reset(singletons.PartsGroup.get(), *groups)
         self.move(pos)
 
     def get_image(self):
-        if not self.original_image:
-            self.original_image = utils.crop_image(self.get_base_image(), random.choice(self.sprite_rect))
-        return self.original_image
+        return self.get_cropped_image(self.sprite_index)
+
+    def get_atlas_key(self):
+        return self.__class__.__name__, self.sprite_index
 
     @classmethod
-    def get_base_image(cls):
-        if not cls.base_image:
-            cls.base_image = utils.load_image(config.images['parts'])
-        return cls.base_image
+    def get_rotation_steps(cls) -> int:
+        return get_rotation_steps()
+
+    @classmethod
+    def get_cropped_image(cls, index):
+        key = cls.__name__, index
+        if key not in Part.cropped_images:
+            Part.cropped_images[key] = utils.load_region(config.images['parts'], cls.sprite_rect[index])
+        return Part.cropped_images[key]
 
 
 class RedApplePart(Part):
@@ -296,3 +323,20 @@ class FrozenApplePart(Part):
     sprite_rect = [
         pygame.Rect(18, 1379, 131, 125)
     ]
+
+
+rotation_steps = 0  # Found on first use, see get_rotation_steps
+
+
+def get_rotation_steps() -> int:
+    # Every fruit and part is rendered at the same number of angles: the most whose frames all fit in
+    # config.rotation_memory, at most config.rotation_steps
+    global rotation_steps
+    if not rotation_steps:
+        images = [fruit_class.get_image() for fruit_class in Fruit.__subclasses__()] + [
+            part_class.get_cropped_image(index)
+            for part_class in Part.__subclasses__() for index in range(len(part_class.sprite_rect))
+        ]
+        revolution = sum(objects.RotationAtlas.get_frame_size(image) for image in images)
+        rotation_steps = max(1, min(config.rotation_steps, int(config.rotation_memory // revolution)))
+    return rotation_steps
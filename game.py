@@ -13,7 +13,7 @@ class Game:
         self._pause = False
 
     def reload(self, mode) -> None:
-        self.score = 0
+        self._score = 0  # Not through the setter, which would double the change if double was on at the end
         self.best_score = managers.DatabaseManager.get_instance().get_best_score(mode)
         self.fruits_missed = 0
         self.critical_combo = 0
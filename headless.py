@@ -0,0 +1,173 @@
+import os
+import sys
+import time
+import atexit
+import shutil
+import typing
+import sqlite3
+import tempfile
+import pygame
+import inputs
+import managers
+import replay
+import singletons
+import screens
+import fruits
+import utils
+import config
+
+
+# Clock of headless runs: every frame lasts 1 / fps and nothing waits
+class SimulatedClock:
+    def __init__(self, fps: int = config.fps):
+        self.fps = fps
+        self.time = 0.0
+        self.frames = 0
+
+    def tick(self, framerate: int = 0) -> float:
+        # The frame rate of the run, not the one the screen asks for (config.fps)
+        self.time = 1000.0 / self.fps
+        self.frames += 1
+        return self.time
+
+    def get_time(self) -> float:
+        return self.time
+
+    def get_fps(self) -> float:
+        return float(self.fps)
+
+
+scratch_database: typing.Optional[str] = None
+
+
+def use_scratch_database() -> str:
+    # Headless runs write their scores and sessions to a temporary copy of the database, the copy keeps the best
+    # scores of the player so the game plays the same. Must run before the database is first used
+    global scratch_database
+    if scratch_database is None:
+        directory = tempfile.mkdtemp(prefix='fruit_mania_')
+        atexit.register(shutil.rmtree, directory, True)  # Runs after the database writer's flush at exit
+        scratch_database = os.path.join(directory, os.path.basename(config.database))
+        source, copy = sqlite3.connect(config.database), sqlite3.connect(scratch_database)
+        source.backup(copy)  # Includes what is still in the write-ahead log
+        source.close()
+        copy.close()
+        config.database = scratch_database
+    return scratch_database
+
+
+# Runs the game on SDL's dummy drivers with synthetic input and a scratch copy of the database
+class Runner:
+    def __init__(self, fps: int = config.fps):
+        # Read by SDL when the display and the mixer are initialized
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        config.headless = True
+        use_scratch_database()
+        self.screen = utils.init()
+        self.clock = SimulatedClock(fps)
+        self.input = inputs.set_synthetic(inputs.SyntheticInput((config.width // 2, config.height // 2)))
+        self.frames = 0
+        managers.ScreensManager.set_screens(
+            screens.Loading,
+            screens.MainMenu,
+            screens.Classic,
+            screens.Arcade,
+            screens.EndTable,
+            screens.Quit,
+        )
+
+    def load(self) -> None:
+        while managers.ScreensManager.next_screen is screens.Loading:
+            self.step()
+
+    def start(self, screen: typing.Type[screens.Screen]) -> None:
+        # Sprites, timers and input of the previous screen must not leak into the next one
+        self.leave()
+        pygame.event.clear()
+        managers.ScreensManager.set_next_screen(screen)
+        self.frames = 0
+
+    def stop(self) -> replay.Recording:
+        # Ends the game session the way leaving its screen does, and returns the recording of its input
+        recording = replay.stop(managers.GameManager.get_instance().score) or replay.last
+        self.leave()
+        return recording
+
+    def leave(self) -> None:
+        screen = managers.ScreensManager.get_next_screen()
+        if hasattr(screen, 'delete_all'):
+            screen.delete_all()
+
+    def step(self) -> None:
+        managers.ScreensManager.get_next_screen().loop(self.screen, self.clock)
+        self.frames += 1
+
+    def run(self, frames: int, script: typing.Optional[typing.Callable[['Runner', int], None]] = None) -> None:
+        for frame in range(frames):
+            if script:
+                script(self, frame)
+            self.step()
+
+
+def swipe_fruits(runner: Runner, frame: int) -> None:
+    # Simple bot: keeps the blade down and follows the lowest fruit on screen, leaving the bombs alone
+    if not runner.input.buttons[0]:
+        runner.input.press()
+    screen_rect = runner.screen.get_rect()
+    targets = [
+        fruit for fruit in singletons.FruitsGroup.get()
+        if not isinstance(fruit, fruits.Bomb) and screen_rect.colliderect(fruit.rect)
+    ]
+    if targets:
+        runner.input.move(max(targets, key=lambda fruit: fruit.rect.bottom).rect.center)
+
+
+def replay_recording(runner: Runner, recording: replay.Recording) -> replay.Recording:
+    # Runs the recorded session again and returns its new recording, which matches when the replay is exact
+    replay.play(recording)
+    runner.start(screens.Classic if recording.mode == screens.Classic.mode else screens.Arcade)
+    while replay.session is not None and not replay.session.finished:
+        runner.step()
+    return runner.stop()
+
+
+def main() -> None:
+    # python headless.py classic|arcade [seconds] [recording path] or
+    # python headless.py replay <recording path> [fps...], which replays at every frame rate given
+    modes = {'classic': screens.Classic, 'arcade': screens.Arcade}
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'arcade'
+    runner = Runner()
+    runner.load()
+    started = time.perf_counter()
+    if mode == 'replay':
+        recording = replay.Recording.load(sys.argv[2])
+        identical = True
+        for fps in [int(fps) for fps in sys.argv[3:]] or [runner.clock.fps]:
+            # Ticks do not depend on the frame rate, so neither does the replay
+            runner.clock.fps = fps
+            started = time.perf_counter()
+            replayed = replay_recording(runner, recording)
+            same = replayed.to_bytes() == recording.to_bytes()
+            identical = identical and same
+            print(
+                f'replay at {fps} fps: {len(replayed)} of {len(recording)} ticks in '
+                f'{time.perf_counter() - started:.2f} s, score {replayed.score} (recorded {recording.score}), '
+                f'{"identical" if same else "DIFFERENT"}'
+            )
+        sys.exit(0 if identical else 1)
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 30.0
+    runner.start(modes[mode])
+    runner.run(int(seconds * runner.clock.fps), swipe_fruits)
+    elapsed = time.perf_counter() - started
+    recording = runner.stop()
+    if len(sys.argv) > 3:
+        recording.save(sys.argv[3])
+    print(
+        f'{mode}: {runner.frames} frames ({seconds:.1f} s of game) in {elapsed:.2f} s, '
+        f'{runner.frames / elapsed:.0f} frames/s, score {recording.score}, {len(recording)} ticks recorded'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import typing
+import pygame
+
+
+# Mouse and keyboard set by code, posting the events a device would
+class SyntheticInput:
+    def __init__(self, pos: typing.Tuple[int, int] = (0, 0)):
+        self.pos = pos
+        self.buttons = [False, False, False]
+        self.keys: typing.Set[int] = set()
+
+    def move(self, pos: typing.Tuple[int, int]) -> None:
+        rel = pos[0] - self.pos[0], pos[1] - self.pos[1]
+        self.pos = pos
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=tuple(self.buttons)))
+
+    def press(self, button: int = 1) -> None:
+        self.buttons[button - 1] = True
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=self.pos, button=button))
+
+    def release(self, button: int = 1) -> None:
+        self.buttons[button - 1] = False
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=self.pos, button=button))
+
+    def press_key(self, key: int) -> None:
+        self.keys.add(key)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+
+    def release_key(self, key: int) -> None:
+        self.keys.discard(key)
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode='', scancode=0))
+
+
+synthetic: typing.Optional[SyntheticInput] = None
+
+
+def set_synthetic(state: typing.Optional[SyntheticInput]) -> typing.Optional[SyntheticInput]:
+    # None goes back to the devices
+    global synthetic
+    synthetic = state
+    return state
+
+
+def get_pos() -> typing.Tuple[int, int]:
+    return synthetic.pos if synthetic else pygame.mouse.get_pos()
+
+
+def get_pressed() -> typing.Tuple[bool, bool, bool]:
+    return tuple(synthetic.buttons) if synthetic else pygame.mouse.get_pressed()
+
+
+def is_key_pressed(key: int) -> bool:
+    return key in synthetic.keys if synthetic else pygame.key.get_pressed()[key]
@@ -1,12 +1,38 @@
-import pygame
-import managers
-import screens
-import utils
-import config
+import sys
+import time
+
+started = time.perf_counter()
+timeline = []  # (event, seconds since start), reported with --profile-startup
+
+
+def mark(event: str) -> None:
+    timeline.append((event, time.perf_counter() - started))
+
+
+import pygame  # noqa: E402
+mark('import pygame')
+import config  # noqa: E402
+import utils  # noqa: E402
+mark('import config, utils')
+import managers  # noqa: E402
+import screens  # noqa: E402
+import profiler  # noqa: E402
+mark('import managers, screens and game modules')
+
+
+def report_startup() -> None:
+    previous = 0.0
+    print('Startup timeline:', file=sys.stderr)
+    for event, moment in timeline:
+        print(f'{moment * 1000:9.1f} ms {(moment - previous) * 1000:+9.1f} ms  {event}', file=sys.stderr)
+        previous = moment
 
 
 def main() -> None:
+    profile_startup = '--profile-startup' in sys.argv[1:]
+    profiler.frames.set_visible(config.frame_profiler or '--profile-frames' in sys.argv[1:])
     screen = utils.init()
+    mark('display and mixer init')
     clock = pygame.time.Clock()
     managers.ScreensManager.set_screens(
         screens.Loading,
@@ -16,7 +42,15 @@ def main() -> None:
         screens.EndTable,
         screens.Quit,
     )
+    mark('screens created')
     pygame.display.set_caption(config.game_name)
+    managers.ScreensManager.get_next_screen().loop(screen, clock)
+    mark('first frame')
+    while managers.ScreensManager.next_screen is screens.Loading:
+        managers.ScreensManager.get_next_screen().loop(screen, clock)
+    mark('assets loaded, main menu entered')
+    if profile_startup:
+        report_startup()
     while True:
         managers.ScreensManager.get_next_screen().loop(screen, clock)
 
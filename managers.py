@@ -1,43 +1,60 @@
 import typing
-import screens
+import screens  # Only used in annotations, as strings: screens import this module and are not loaded yet
 import game
 import database
+import sounds
 
 
 class ScreensManager:
-    next_screen: typing.Type[screens.Screen] = screens.Loading
+    next_screen: typing.Optional[typing.Type['screens.Screen']] = None  # The first one given to set_screens
     screen_dictionary = {}
 
     @classmethod
-    def get_next_screen(cls) -> screens.Screen:
+    def get_next_screen(cls) -> 'screens.Screen':
         return cls.screen_dictionary[cls.next_screen]
 
     @classmethod
-    def set_next_screen(cls, screen: typing.Type[screens.Screen]) -> None:
-        cls.next_screen = screen
+    def set_next_screen(cls, screen: typing.Type['screens.Screen']) -> None:
+        previous, cls.next_screen = cls.next_screen, screen
         cls.screen_dictionary[cls.next_screen].reload()
+        if previous is not screen:
+            previous.evict()
 
     @classmethod
-    def set_screens(cls, *screen_sequence: typing.Type[screens.Screen]):
+    def set_screens(cls, *screen_sequence: typing.Type['screens.Screen']):
+        if cls.next_screen is None:
+            cls.next_screen = screen_sequence[0]
         for screen in screen_sequence:
             cls.screen_dictionary[screen] = screen()
 
     @classmethod
-    def get_screen(cls, screen: typing.Type[screens.Screen]) -> screens.Screen:
+    def get_screen(cls, screen: typing.Type['screens.Screen']) -> 'screens.Screen':
         return cls.screen_dictionary[screen]
 
 
 class GameManager:
-    game_instance: game.Game = game.Game()
+    game_instance: typing.Optional['game.Game'] = None  # Created on first use, game imports this module
 
     @classmethod
     def get_instance(cls):
+        if cls.game_instance is None:
+            cls.game_instance = game.Game()
         return cls.game_instance
 
 
 class DatabaseManager:
-    db_instance: database.Database = database.Database()
+    db_instance: database.Database = None  # Connected on first use, not at import
 
     @classmethod
     def get_instance(cls):
+        if cls.db_instance is None:
+            cls.db_instance = database.Database()
         return cls.db_instance
+
+
+class SoundsManager:
+    bank_instance: sounds.SoundBank = sounds.SoundBank()
+
+    @classmethod
+    def get_instance(cls):
+        return cls.bank_instance
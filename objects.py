@@ -1,6 +1,9 @@
 import math
-import random
+import typing
+import itertools
 import pygame
+import scheduler
+import surfaces
 import utils
 import config
 
@@ -8,31 +11,48 @@ import config
 class Entity(pygame.sprite.Sprite):
     image: pygame.Surface = 0
     sprite_rect = pygame.Rect((0, 0, 0, 0))
-
-    def __init__(self, *groups):
-        super().__init__(*groups)
+    serials = itertools.count()  # Spawn order, which breaks ties where set order would depend on object ids
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.engine = None
+        self.engine_index = -1
+        self.spatial_index = None  # Of the group, when it has no physics engine
+        self.reset(*args, **kwargs)
+
+    def reset(self, *groups):
+        # State is set before joining the groups, so that a physics engine of the group can pick it up
+        self.serial = next(Entity.serials)
         self.image = self.get_image()
         self.rect = self.image.get_rect()
+        # Bounds of the image turned by any angle, around the center
+        self.radius = math.ceil(math.hypot(*self.rect.size) / 2) + 1
+        # Float positions of the center at the current and at the previous simulation tick
+        self._center = self.rect.center
+        self._previous_center = self._center
         self._velocity = (0, 0)
         self._personal_gravity = -1
+        self.add(*groups)
 
     @property
     def velocity(self):
-        x, y = self._velocity
+        x, y = self.engine.velocities[self.engine_index].tolist() if self.engine else self._velocity
         if config.freeze_gravity:
             divider = config.gravity / config.freeze_gravity
-            x = math.ceil(x / divider)
-            y = math.ceil(y / divider)
+            x /= divider
+            y /= divider
         return x, y
 
     @velocity.setter
     def velocity(self, value):
         x, y = value
         if config.freeze_gravity:
-            divider = config.gravity // config.freeze_gravity
+            divider = config.gravity / config.freeze_gravity
             x *= divider
             y *= divider
         self._velocity = x, y
+        if self.engine:
+            self.engine.velocities[self.engine_index] = x, y
 
     @property
     def personal_gravity(self):
@@ -41,18 +61,55 @@ class Entity(pygame.sprite.Sprite):
     @personal_gravity.setter
     def personal_gravity(self, value):
         self._personal_gravity = value
+        if self.engine:
+            self.engine.gravities[self.engine_index] = value
 
     def move(self, offset):
+        # Moves without a trace between ticks, so the move is not interpolated
         x, y = offset
         self.rect.x += x
         self.rect.y += y
+        self._center = self._center[0] + x, self._center[1] + y
+        self._previous_center = self._previous_center[0] + x, self._previous_center[1] + y
+        if self.engine:
+            self.engine.centers[self.engine_index] += x, y
+            self.engine.previous_centers[self.engine_index] += x, y
+        if self.spatial_index:
+            self.spatial_index.update(self, self.get_tick_bounds())
+
+    def get_tick_center(self):
+        # At the current simulation tick, what the game checks (cuts, culling). The rect is only where it is drawn
+        x, y = self.engine.centers[self.engine_index].tolist() if self.engine else self._center
+        return round(x), round(y)
+
+    def get_tick_bounds(self):
+        x, y = self.get_tick_center()
+        return pygame.Rect(x - self.radius, y - self.radius, 2 * self.radius, 2 * self.radius)
+
+    def place(self, center, angle):
+        self.rect.center = center
+
+    def interpolate(self, alpha):
+        (x, y), (previous_x, previous_y) = self._center, self._previous_center
+        center = round(previous_x + (x - previous_x) * alpha), round(previous_y + (y - previous_y) * alpha)
+        self.place(center, self.drawn_angle)
 
     def update(self, *args):
         gravity = self.personal_gravity if self.personal_gravity != -1 else self.get_gravity()
         x_velocity, y_velocity = self.velocity
-        self.move((self.get_frame_speed(x_velocity), self.get_frame_speed(y_velocity)))
+        x, y = self._center
+        self._previous_center = self._center
+        self._center = x + self.get_frame_speed(x_velocity), y + self.get_frame_speed(y_velocity)
         self.velocity = (x_velocity, y_velocity + gravity)
 
+    @property
+    def angle(self):
+        return 0
+
+    @property
+    def drawn_angle(self):
+        return 0
+
     @classmethod
     def get_gravity(cls):
         return config.gravity if not config.freeze_gravity else config.freeze_gravity
@@ -64,35 +121,120 @@ class Entity(pygame.sprite.Sprite):
     @classmethod
     def get_image(cls):
         if not cls.image:
-            cls.image = utils.crop_image(utils.load_image(f'parts.png'), cls.sprite_rect)
+            cls.image = utils.load_region(config.images['parts'], cls.sprite_rect)
         return cls.image
 
     @staticmethod
     def get_frame_speed(speed):
-        return math.ceil(speed // config.fps)
+        return speed / config.tick_rate
+
+
+# Frames of an image at quantized angles, with their masks, rendered on first request
+class RotationAtlas:
+    def __init__(
+            self, image: pygame.Surface, steps: int = config.rotation_steps, name: str = '', with_masks: bool = True
+    ):
+        self.image = image
+        self.kind = surfaces.get_kind(image)
+        self.with_masks = with_masks
+        self.steps = steps
+        self.step = 360.0 / steps
+        self.images: typing.List[typing.Optional[pygame.Surface]] = [None] * steps
+        self.masks: typing.List[typing.Optional[pygame.mask.Mask]] = [None] * steps
+        if name:
+            surfaces.register(f'{name} rotations', self.kind, self.images)
+
+    def get_index(self, angle: float) -> int:
+        return int(round(angle / self.step)) % self.steps
+
+    @staticmethod
+    def get_frame_size(image: pygame.Surface, with_masks: bool = True) -> float:
+        # Mean size in bytes of a frame of the image rotated by any angle, the mean number of pixels being that of
+        # (w |cos| + h |sin|) (w |sin| + h |cos|). Masks take a bit per pixel
+        w, h = image.get_size()
+        return (w * h + (w * w + h * h) / math.pi) * (image.get_bytesize() + (0.125 if with_masks else 0))
+
+    def get(self, angle: float) -> typing.Tuple[pygame.Surface, pygame.mask.Mask]:
+        index = self.get_index(angle)
+        if self.images[index] is None:
+            self.render(index)
+        return self.images[index], self.masks[index]
+
+    def render(self, index: int) -> None:
+        image = pygame.transform.rotate(self.image, index * self.step)
+        # The mask first: reading the pixels of a run-length encoded surface decodes it
+        if self.with_masks:
+            self.masks[index] = pygame.mask.from_surface(image)
+        self.images[index] = surfaces.prepare(image, self.kind)
+
+    def build(self) -> None:
+        for index in range(self.steps):
+            if self.images[index] is None:
+                self.render(index)
+
+    def set_steps(self, steps: int) -> None:
+        # Frames rendered at other angles are dropped
+        if steps != self.steps:
+            self.steps = steps
+            self.step = 360.0 / steps
+            self.clear()
+
+    def clear(self) -> None:
+        # Frees the frames, they are rendered again on request. In place, the lists are registered in surfaces
+        self.images[:] = [None] * self.steps
+        self.masks[:] = [None] * self.steps
 
 
 class RotatingEntity(Entity):
-    def __init__(self, *groups):
-        super().__init__(*groups)
+    atlases: typing.Dict[typing.Hashable, RotationAtlas] = {}
+
+    def reset(self, *groups):
         self._angle = 0
-        self._angle_delta = random.uniform(-2.0, 2.0)
-        self.mask = pygame.mask.from_surface(self.image)
+        self._drawn_angle = 0  # Angle of the current tick, the angle is already that of the next one
+        self._angle_delta = scheduler.rng.uniform(-2.0, 2.0)
+        self.atlas = self.get_atlas()
+        super().reset(*groups)
+        self.image, self.mask = self.atlas.get(self.angle)
 
     def update(self, *args):
         super().update(*args)
-        self.image = pygame.transform.rotate(self.get_image(), self.angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
-        self.mask = pygame.mask.from_surface(self.image)
+        self._drawn_angle = self.angle
         self.angle = self.angle + self.angle_delta
 
+    def place(self, center, angle):
+        self.image, self.mask = self.atlas.get(angle)
+        self.rect = self.image.get_rect(center=center)
+
+    def get_tick_frame(self) -> typing.Tuple[pygame.Rect, pygame.mask.Mask]:
+        image, mask = self.atlas.get(self.drawn_angle)
+        return image.get_rect(center=self.get_tick_center()), mask
+
+    def get_atlas_key(self) -> typing.Hashable:
+        return self.__class__.__name__
+
+    def get_atlas(self) -> RotationAtlas:
+        key = self.get_atlas_key()
+        if key not in RotatingEntity.atlases:
+            RotatingEntity.atlases[key] = RotationAtlas(self.get_image(), self.get_rotation_steps(), str(key))
+        return RotatingEntity.atlases[key]
+
+    @classmethod
+    def get_rotation_steps(cls) -> int:
+        return config.rotation_steps
+
     @property
     def angle(self):
-        return self._angle
+        return float(self.engine.angles[self.engine_index]) if self.engine else self._angle
 
     @angle.setter
     def angle(self, value):
         self._angle = value
+        if self.engine:
+            self.engine.angles[self.engine_index] = value
+
+    @property
+    def drawn_angle(self):
+        return float(self.engine.drawn_angles[self.engine_index]) if self.engine else self._drawn_angle
 
     @property
     def angle_delta(self):
@@ -101,3 +243,5 @@ class RotatingEntity(Entity):
     @angle_delta.setter
     def angle_delta(self, value):
         self._angle_delta = value
+        if self.engine:
+            self.engine.angle_deltas[self.engine_index] = value
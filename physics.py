@@ -0,0 +1,197 @@
+import typing
+import pygame
+import config
+
+try:
+    import numpy
+except ImportError:  # The vectorized engine is optional, entities fall back to their own update
+    numpy = None
+
+
+def is_enabled() -> bool:
+    return numpy is not None and config.physics_engine == 'numpy'
+
+
+# Steps all entities of a group at once, their state is kept in NumPy arrays
+class Engine:
+    def __init__(self, capacity: int = config.physics_capacity):
+        self.size = 0
+        self.sprites: typing.List[pygame.sprite.Sprite] = []
+        self.centers = numpy.zeros((capacity, 2))
+        self.previous_centers = numpy.zeros((capacity, 2))
+        self.velocities = numpy.zeros((capacity, 2))
+        self.gravities = numpy.full(capacity, -1.0)
+        self.angles = numpy.zeros(capacity)
+        self.drawn_angles = numpy.zeros(capacity)
+        self.angle_deltas = numpy.zeros(capacity)
+        self.half_sizes = numpy.zeros((capacity, 2))
+        self.radii = numpy.zeros(capacity, dtype=int)
+        self.visible = numpy.zeros(capacity, dtype=bool)
+
+    def grow(self) -> None:
+        capacity = len(self.centers) * 2
+        for name in self.get_array_names():
+            array = getattr(self, name)
+            grown = numpy.full((capacity, *array.shape[1:]), -1.0 if name == 'gravities' else 0, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            setattr(self, name, grown)
+
+    @staticmethod
+    def get_array_names() -> typing.Tuple[str, ...]:
+        return (
+            'centers', 'previous_centers', 'velocities', 'gravities', 'angles', 'drawn_angles', 'angle_deltas',
+            'half_sizes', 'radii', 'visible'
+        )
+
+    def add(self, sprite) -> None:
+        if sprite.engine is self:
+            return
+        if self.size == len(self.centers):
+            self.grow()
+        i = self.size
+        self.centers[i] = sprite._center
+        self.previous_centers[i] = sprite._previous_center
+        self.velocities[i] = sprite._velocity
+        self.gravities[i] = sprite._personal_gravity
+        self.angles[i] = getattr(sprite, '_angle', 0)
+        self.drawn_angles[i] = getattr(sprite, '_drawn_angle', 0)
+        self.angle_deltas[i] = getattr(sprite, '_angle_delta', 0)
+        self.half_sizes[i] = sprite.rect.w / 2, sprite.rect.h / 2
+        self.radii[i] = sprite.radius
+        self.visible[i] = True
+        self.sprites.append(sprite)
+        sprite.engine, sprite.engine_index = self, i
+        self.size += 1
+
+    def hand_back(self, indices: numpy.ndarray) -> typing.List[pygame.sprite.Sprite]:
+        # Hands the state back to the sprites and detaches them, so they stay consistent outside of the engine
+        detached = []
+        for i, center, previous_center, velocity, gravity, angle, drawn_angle in zip(
+                indices.tolist(), self.centers[indices].tolist(), self.previous_centers[indices].tolist(),
+                self.velocities[indices].tolist(), self.gravities[indices].tolist(), self.angles[indices].tolist(),
+                self.drawn_angles[indices].tolist()
+        ):
+            sprite = self.sprites[i]
+            sprite._center, sprite._previous_center = tuple(center), tuple(previous_center)
+            sprite._velocity = tuple(velocity)
+            sprite._personal_gravity = gravity
+            if hasattr(sprite, '_angle'):
+                sprite._angle, sprite._drawn_angle = angle, drawn_angle
+            sprite.place((round(center[0]), round(center[1])), drawn_angle)
+            sprite.engine, sprite.engine_index = None, -1
+            detached.append(sprite)
+        return detached
+
+    def remove(self, sprite) -> None:
+        if sprite.engine is not self:
+            return
+        i, last = sprite.engine_index, self.size - 1
+        self.hand_back(numpy.array([i]))
+        if i != last:
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved.engine_index = i
+            for name in self.get_array_names():
+                array = getattr(self, name)
+                array[i] = array[last]
+        self.sprites.pop()
+        self.size -= 1
+
+    def remove_many(self, indices: numpy.ndarray) -> typing.List[pygame.sprite.Sprite]:
+        # Removes the sprites at the (unique) indices at once and returns them. The last sprites that are kept fill
+        # the holes, so the arrays are compacted in one pass and only the moved sprites get a new index
+        if not len(indices):
+            return []
+        removed = self.hand_back(indices)
+        size = self.size - len(indices)
+        kept = numpy.ones(self.size, dtype=bool)
+        kept[indices] = False
+        holes = numpy.flatnonzero(~kept[:size])
+        moved = numpy.flatnonzero(kept[size:]) + size
+        for name in self.get_array_names():
+            array = getattr(self, name)
+            array[holes] = array[moved]
+        for hole, i in zip(holes.tolist(), moved.tolist()):
+            sprite = self.sprites[i]
+            self.sprites[hole] = sprite
+            sprite.engine_index = hole
+        del self.sprites[size:]
+        self.size = size
+        return removed
+
+    def get_effective_velocities(self) -> numpy.ndarray:
+        velocities = self.velocities[:self.size]
+        if config.freeze_gravity:
+            return velocities / (config.gravity / config.freeze_gravity)
+        return velocities.copy()
+
+    def step(self) -> None:
+        n = self.size
+        if not n:
+            return
+        # Same rules as objects.Entity.update, for all entities at once
+        velocities = self.get_effective_velocities()
+        self.previous_centers[:n] = self.centers[:n]
+        self.centers[:n] += velocities / config.tick_rate
+        gravity = config.gravity if not config.freeze_gravity else config.freeze_gravity
+        gravities = self.gravities[:n]
+        velocities[:, 1] += numpy.where(gravities != -1, gravities, gravity)
+        if config.freeze_gravity:
+            velocities *= config.gravity / config.freeze_gravity
+        self.velocities[:n] = velocities
+        self.drawn_angles[:n] = self.angles[:n]
+        self.angles[:n] += self.angle_deltas[:n]
+
+    def get_visible(self, centers: numpy.ndarray) -> numpy.ndarray:
+        half_sizes = self.half_sizes[:self.size]
+        return (
+            (centers[:, 0] + half_sizes[:, 0] > 0) & (centers[:, 0] - half_sizes[:, 0] < config.width) &
+            (centers[:, 1] + half_sizes[:, 1] > 0) & (centers[:, 1] - half_sizes[:, 1] < config.height)
+        )
+
+    def interpolate(self, alpha: float) -> typing.List[pygame.sprite.Sprite]:
+        n = self.size
+        if not n:
+            return []
+        # Visible at either end of the interpolated move. Sprites that have just left the screen are written
+        # once more, so they are not left drawn at the edge
+        visible = self.get_visible(self.centers[:n]) | self.get_visible(self.previous_centers[:n])
+        indices = numpy.flatnonzero(visible | self.visible[:n])
+        previous_centers = self.previous_centers[indices]
+        centers = numpy.rint(previous_centers + (self.centers[indices] - previous_centers) * alpha).astype(int)
+        sizes = []
+        placed = []
+        for i, center, angle in zip(indices.tolist(), centers.tolist(), self.drawn_angles[indices].tolist()):
+            sprite = self.sprites[i]
+            sprite.place(center, angle)
+            sizes.append(sprite.rect.size)
+            placed.append(sprite)
+        if sizes:
+            self.half_sizes[indices] = numpy.array(sizes) / 2
+        self.visible[:n] = visible
+        return placed
+
+    def get_tick_bounds(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        # Top left corners and sizes, as objects.Entity.get_tick_bounds: from the state of the tick, never drawn rects
+        radii = self.radii[:self.size]
+        return numpy.rint(self.centers[:self.size]).astype(int) - radii[:, None], 2 * radii
+
+    def query(self, rect: pygame.Rect) -> typing.List[pygame.sprite.Sprite]:
+        n = self.size
+        if not n:
+            return []
+        corners, sizes = self.get_tick_bounds()
+        x, y = corners[:, 0], corners[:, 1]
+        hits = (x < rect.right) & (x + sizes > rect.left) & (y < rect.bottom) & (y + sizes > rect.top)
+        return [self.sprites[i] for i in numpy.flatnonzero(hits).tolist()]
+
+    def get_invisible(self) -> numpy.ndarray:
+        n = self.size
+        if not n:
+            return numpy.zeros(0, dtype=int)
+        corners, sizes = self.get_tick_bounds()
+        x, y = corners[:, 0], corners[:, 1]
+        # Верхнюю границу пересекать может, т.к. под силой тяжести все равно упадет
+        outside = ~((-sizes < x) & (x < config.width)) | (y > config.height)
+        falling = self.get_effective_velocities()[:, 1] > 0
+        return numpy.flatnonzero(outside & falling)
@@ -0,0 +1,60 @@
+import typing
+import config
+
+
+class Pool:
+    def __init__(self, sprite_class: type, size: int = config.pool_size):
+        self.sprite_class = sprite_class
+        self.size = size
+        self.free: typing.List = []
+        self.created = 0
+        self.reused = 0
+        self.peak_free = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args, **kwargs)
+            self.reused += 1
+            return sprite
+        self.created += 1
+        return self.sprite_class(*args, **kwargs)
+
+    def release(self, sprite) -> None:
+        if len(self.free) < self.size:
+            self.free.append(sprite)
+            self.peak_free = max(self.peak_free, len(self.free))
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'free': len(self.free),
+            'peak_free': self.peak_free,
+        }
+
+
+pools: typing.Dict[type, Pool] = {}
+
+
+def get_pool(sprite_class: type) -> Pool:
+    if sprite_class not in pools:
+        pools[sprite_class] = Pool(sprite_class)
+    return pools[sprite_class]
+
+
+def get_stats() -> typing.Dict[str, typing.Dict[str, int]]:
+    return {sprite_class.__name__: pool.get_stats() for sprite_class, pool in pools.items()}
+
+
+# Goes first in the bases, so that its kill runs before the sprite's own
+class Poolable:
+    @classmethod
+    def create(cls, *args, **kwargs):
+        return get_pool(cls).acquire(*args, **kwargs)
+
+    def kill(self):
+        alive = self.alive()
+        super().kill()
+        if alive:
+            get_pool(self.__class__).release(self)
@@ -0,0 +1,133 @@
+import time
+import typing
+import collections
+import pygame
+import managers
+import singletons
+import pools
+import utils
+import config
+
+
+# Times the phases of the last frames (see Screen.loop) and shows them in an overlay
+class FrameProfiler:
+    def __init__(self, size: int = config.profiler_frames):
+        self.visible = config.frame_profiler
+        self.enabled = self.visible or config.session_telemetry
+        self.size = size
+        self.frames: typing.Deque[typing.Tuple[float, typing.Dict[str, float]]] = collections.deque(maxlen=size)
+        self.phases: typing.Dict[str, float] = {}  # Phase -> seconds, of the current frame
+        self.steps: typing.Set[str] = set()  # Phases that are parts of other phases
+        self.started = 0.0
+        self.last = 0.0
+        self.fps = 0.0
+        self.overlay: typing.Optional[pygame.Surface] = None
+        self.overlay_age = 0
+
+    def set_visible(self, visible: bool) -> None:
+        self.visible = visible
+        self.enabled = visible or config.session_telemetry
+        self.overlay = None
+
+    def toggle(self) -> None:
+        self.set_visible(not self.visible)
+
+    def start(self) -> None:
+        if self.enabled:
+            self.phases = {}
+            self.started = self.last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        # The phase took the time since the previous mark
+        if self.enabled:
+            moment = time.perf_counter()
+            self.add(phase, moment - self.last)
+            self.last = moment
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def call(self, phase: str, function: typing.Callable, *args, **kwargs):
+        # Sub-step of a marked phase, its time is counted in that phase too
+        if not self.enabled:
+            return function(*args, **kwargs)
+        self.steps.add(phase)
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.add(phase, time.perf_counter() - started)
+
+    def finish(self, clock: pygame.time.Clock) -> None:
+        if self.enabled:
+            self.frames.append((time.perf_counter() - self.started, self.phases))
+            self.fps = clock.get_fps()
+
+    def get_percentile(self, times: typing.List[float], percent: float) -> float:
+        return times[min(len(times) - 1, int(len(times) * percent / 100))] if times else 0.0
+
+    def get_lines(self) -> typing.List[str]:
+        times = sorted(total for total, phases in self.frames)
+        lines = [
+            f'{self.fps:.0f} FPS  frame p50 {self.get_percentile(times, 50) * 1000:.1f}  '
+            f'p95 {self.get_percentile(times, 95) * 1000:.1f}  p99 {self.get_percentile(times, 99) * 1000:.1f}  '
+            f'max {(times[-1] if times else 0.0) * 1000:.1f} ms'
+        ]
+        phases_times: typing.Dict[str, typing.List[float]] = {}
+        for total, phases in self.frames:
+            for phase, seconds in phases.items():
+                phases_times.setdefault(phase, []).append(seconds)
+        for phase, seconds in phases_times.items():
+            # Averaged over all frames, a phase that runs in some frames only is counted as 0 in the rest
+            mean = sum(seconds) / len(self.frames)
+            indent = '    ' if phase in self.steps else '  '
+            lines.append(f'{indent + phase:32} {mean * 1000:6.2f} ms  max {max(seconds) * 1000:6.2f} ms')
+        if self.frames:
+            total, phases = max(self.frames, key=lambda frame: frame[0])
+            slowest = sorted(phases.items(), key=lambda item: item[1], reverse=True)[:3]
+            lines.append(f'slowest {total * 1000:.1f} ms: ' + ', '.join(
+                f'{phase} {seconds * 1000:.1f}' for phase, seconds in slowest
+            ))
+        counts = [
+            f'{holder.__name__[:-len("Group")]} {len(holder.group) if holder.group is not None else 0}'
+            for holder in singletons.Group.__subclasses__()
+        ]
+        lines.append('  '.join(counts))
+        blades = singletons.BladesGroup.group
+        particles = sum(blade.particle_system.get_count() for blade in blades) if blades is not None else 0
+        bank = managers.SoundsManager.get_instance()
+        lines.append(f'particles {particles}  channels {bank.get_busy_channels()}/{len(bank.channels)}')
+        stats = pools.get_stats().values()
+        lines.append(
+            f'pools: {sum(pool["created"] for pool in stats)} created  '
+            f'{sum(pool["reused"] for pool in stats)} reused  {sum(pool["free"] for pool in stats)} free'
+        )
+        return lines
+
+    def render(self) -> pygame.Surface:
+        font = utils.get_font(config.profiler_font_size, None)
+        lines = [font.render(line, True, (255, 255, 255)) for line in self.get_lines()]
+        overlay = pygame.Surface(
+            (max(line.get_width() for line in lines) + 8, sum(line.get_height() for line in lines) + 8),
+            pygame.SRCALPHA
+        )
+        overlay.fill((0, 0, 0, 160))
+        y = 4
+        for line in lines:
+            overlay.blit(line, (4, y))
+            y += line.get_height()
+        return overlay
+
+    def draw(self, screen: pygame.Surface) -> None:
+        # The text changes every frame, so it is rendered again only a few times per second to stay readable
+        # and not to be the slowest phase itself
+        if not self.visible:
+            return
+        self.overlay_age -= 1
+        if self.overlay is None or self.overlay_age <= 0:
+            self.overlay = self.render()
+            self.overlay_age = config.profiler_refresh
+        screen.blit(self.overlay, self.overlay.get_rect(bottomleft=(8, config.height - 8)))
+
+
+frames = FrameProfiler()
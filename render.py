@@ -0,0 +1,84 @@
+import typing
+import pygame
+import config
+
+
+# Sends only the areas drawn in the previous and the current frame to the display
+class DirtyRenderer:
+    def __init__(self, surface: pygame.Surface):
+        self.surface = surface
+        self.background = pygame.Surface(surface.get_size()).convert()
+        self.owner = None
+        self.full = True
+        self.previous: typing.List[pygame.Rect] = []
+        self.drawn: typing.List[pygame.Rect] = []
+
+    def invalidate(self) -> None:
+        self.full = True
+
+    def restore(self, owner) -> None:
+        if owner is not self.owner or self.full:
+            self.owner = owner
+            owner.draw_background(self.background)
+            self.surface.blit(self.background, (0, 0))
+            self.full = True
+        elif self.previous:
+            self.surface.blits([(self.background, rect, rect) for rect in self.previous], False)
+        self.drawn = []
+
+    def get_dirty(self) -> typing.List[pygame.Rect]:
+        if self.full:
+            dirty = [self.surface.get_rect()]
+            self.full = False
+        else:
+            dirty = [rect for rect in self.previous + self.drawn if rect]
+            if len(dirty) > config.dirty_rects_limit:
+                dirty = [dirty[0].unionall(dirty)]
+        self.previous = self.drawn
+        return dirty
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0) -> pygame.Rect:
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self.drawn.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> typing.Optional[typing.List[pygame.Rect]]:
+        rects = self.surface.blits(blit_sequence, True)
+        self.drawn.extend(rects)
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags: int = 0) -> pygame.Rect:
+        rect = self.surface.fill(color, rect, special_flags)
+        self.drawn.append(rect)
+        return rect
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        return self.surface.get_rect(**kwargs)
+
+    def get_size(self) -> typing.Tuple[int, int]:
+        return self.surface.get_size()
+
+    def get_width(self) -> int:
+        return self.surface.get_width()
+
+    def get_height(self) -> int:
+        return self.surface.get_height()
+
+
+renderer: typing.Optional[DirtyRenderer] = None
+
+# After these the window's content may be lost, so the next frame is drawn whole
+expose_events = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN)
+
+
+def get_renderer(surface: pygame.Surface) -> DirtyRenderer:
+    global renderer
+    if renderer is None or renderer.surface is not surface:
+        renderer = DirtyRenderer(surface)
+    return renderer
+
+
+def invalidate() -> None:
+    # The next frame is drawn and sent to the display whole
+    if renderer is not None:
+        renderer.invalidate()
@@ -0,0 +1,135 @@
+import os
+import time
+import typing
+import random
+import struct
+import zlib
+import inputs
+import config
+
+MAGIC = b'FMRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBBIHiI')  # Magic, version, mode, seed, tick rate, final score, state checksum
+TICK = struct.Struct('<hhB')  # Mouse x, mouse y, flags
+STATE = struct.Struct('<iI')  # Score and number of fruits, folded into the checksum every tick
+
+FLAG_PRESSED = 1
+FLAG_PAUSED = 2
+
+
+# Seed and the mouse and pause state of every tick of one game session
+class Recording:
+    def __init__(self, mode: int, seed: int, tick_rate: int = config.tick_rate):
+        self.mode = mode
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.ticks = bytearray()
+        self.score = 0
+        self.checksum = 0
+
+    def __len__(self) -> int:
+        return len(self.ticks) // TICK.size
+
+    def add(self, pos: typing.Tuple[int, int], pressed: bool, paused: bool) -> None:
+        self.ticks += TICK.pack(pos[0], pos[1], (FLAG_PRESSED if pressed else 0) | (FLAG_PAUSED if paused else 0))
+
+    def get(self, index: int) -> typing.Tuple[typing.Tuple[int, int], bool, bool]:
+        x, y, flags = TICK.unpack_from(self.ticks, index * TICK.size)
+        return (x, y), bool(flags & FLAG_PRESSED), bool(flags & FLAG_PAUSED)
+
+    def to_bytes(self) -> bytes:
+        header = HEADER.pack(MAGIC, VERSION, self.mode, self.seed, self.tick_rate, self.score, self.checksum)
+        return header + bytes(self.ticks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Recording':
+        magic, version, mode, seed, tick_rate, score, checksum = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Not a recording of this version of the game')
+        recording = cls(mode, seed, tick_rate)
+        recording.ticks = bytearray(data[HEADER.size:])
+        recording.score, recording.checksum = score, checksum
+        return recording
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Recording':
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+
+# Records the input of a session, or feeds it from the recording that is replayed
+class Session:
+    def __init__(self, mode: int, seed: int, source: typing.Optional[Recording] = None):
+        self.recording = Recording(mode, seed)
+        self.source = source
+        self.input = None
+        if source and not inputs.synthetic:
+            self.input = inputs.set_synthetic(inputs.SyntheticInput())
+
+    @property
+    def finished(self) -> bool:
+        return self.source is not None and len(self.recording) >= len(self.source)
+
+    def sample(
+            self, pos: typing.Tuple[int, int], pressed: bool, paused: bool, score: int, fruits: int
+    ) -> typing.Tuple[typing.Tuple[int, int], bool, bool]:
+        if self.finished:
+            return pos, False, paused
+        if self.source:
+            pos, pressed, paused = self.source.get(len(self.recording))
+            inputs.synthetic.pos = pos
+            inputs.synthetic.buttons[0] = pressed
+        self.recording.checksum = zlib.crc32(STATE.pack(score, fruits), self.recording.checksum)
+        self.recording.add(pos, pressed, paused)
+        return pos, pressed, paused
+
+    def stop(self, score: int) -> Recording:
+        self.recording.score = score
+        if self.input is not None:
+            inputs.set_synthetic(None)
+        return self.recording
+
+
+session: typing.Optional[Session] = None
+queued: typing.Optional[Recording] = None  # Replayed by the next session of its mode
+last: typing.Optional[Recording] = None  # Recording of the last finished session
+
+
+def play(recording: Recording) -> None:
+    global queued
+    queued = recording
+
+
+def start(mode: int) -> int:
+    # Returns the seed of the new session, which is taken from the recording when it is replayed
+    global session, queued
+    source = None
+    if queued and queued.mode == mode:
+        source, queued = queued, None
+    seed = source.seed if source else random.getrandbits(32)
+    session = Session(mode, seed, source)
+    return seed
+
+
+def sample(
+        pos: typing.Tuple[int, int], pressed: bool, paused: bool, score: int, fruits: int
+) -> typing.Tuple[typing.Tuple[int, int], bool, bool]:
+    if session is None:
+        return pos, pressed, paused
+    return session.sample(pos, pressed, paused, score, fruits)
+
+
+def stop(score: int) -> typing.Optional[Recording]:
+    global session, last
+    if session is None:
+        return None
+    replayed = session.source is not None
+    last, session = session.stop(score), None
+    if config.record_sessions and not replayed:
+        os.makedirs(config.recordings_path, exist_ok=True)
+        last.save(os.path.join(config.recordings_path, f'{last.mode}-{time.strftime("%Y%m%d-%H%M%S")}.fmr'))
+    return last
@@ -0,0 +1,30 @@
+import typing
+import random
+import config
+
+# Every random choice that affects the simulation goes through it, so a session replays from its seed
+rng = random.Random()
+
+
+# pygame.time.set_timer counted in simulation ticks, due events come in the order the timers were set
+class Scheduler:
+    def __init__(self):
+        self.timers: typing.Dict[int, typing.List[int]] = {}  # Event type -> [ticks left, period in ticks]
+
+    def set_timer(self, event_type: int, millis: int) -> None:
+        self.timers.pop(event_type, None)
+        if millis > 0:
+            period = max(1, round(millis * config.tick_rate / 1000))
+            self.timers[event_type] = [period, period]
+
+    def tick(self) -> typing.List[int]:
+        due = []
+        for event_type, timer in self.timers.items():
+            timer[0] -= 1
+            if timer[0] <= 0:
+                timer[0] = timer[1]
+                due.append(event_type)
+        return due
+
+    def clear(self) -> None:
+        self.timers.clear()
@@ -3,11 +3,21 @@ import math
 import datetime
 import random
 import pygame
+import inputs
 import managers
 import singletons
 import fruits
 import blades
+import assets
+import effects
 import sprites
+import render
+import profiler
+import telemetry
+import replay
+import scheduler
+import cache
+import surfaces
 import utils
 import config
 
@@ -16,19 +26,60 @@ class Screen:
     image: pygame.Surface = 0
 
     def __init__(self):
-        self.image = self.get_image()
-        self.rect = self.image.get_rect()
+        # The background image is loaded on first use, most of them by the loading screen
+        self.accumulator = 0.0
 
     def reload(self):
         pass  # For inheritance
 
     def loop(self, screen: pygame.Surface, clock: pygame.time.Clock) -> None:
+        frames = profiler.frames
+        frames.start()
         self.loop_pre(screen)
+        frames.mark('loop_pre')
         self.handle_events()
-        self.update_screen(screen)
-        pygame.display.flip()
+        frames.mark('handle_events')
+        # Fixed timestep: the simulation catches up with the time of the previous frame in whole ticks,
+        # and the rest of it is used to interpolate between the last two ticks when drawing
+        tick = 1.0 / config.tick_rate
+        frame_time = min(clock.get_time() / 1000.0, config.max_frame_time)
+        blades.frame_time = frame_time
+        self.accumulator += frame_time
+        while self.accumulator >= tick:
+            self.update_simulation()
+            self.accumulator -= tick
+            if managers.ScreensManager.get_next_screen() is not self:
+                self.accumulator = 0.0  # The rest of the time belongs to the next screen
+                break
+        frames.mark('update_simulation')
+        self.interpolate(self.accumulator / tick)
+        frames.mark('interpolate')
+        if config.dirty_rendering:
+            renderer = render.get_renderer(screen)
+            renderer.restore(self)
+            frames.mark('restore')
+            self.update_screen(renderer)
+            frames.mark('update_screen')
+            frames.draw(renderer)
+            dirty = renderer.get_dirty()
+            if not config.headless:
+                pygame.display.update(dirty)
+            frames.mark('display.update')
+        else:
+            self.draw_background(screen)
+            frames.mark('draw_background')
+            self.update_screen(screen)
+            frames.mark('update_screen')
+            frames.draw(screen)
+            if not config.headless:
+                pygame.display.flip()
+            frames.mark('display.flip')
         elapsed = clock.tick(config.fps) / 1000.0
+        frames.mark('clock.tick')
         self.loop_post(elapsed)
+        frames.mark('loop_post')
+        frames.finish(clock)
+        telemetry.add_frame()
 
     def loop_pre(self, screen: pygame.Surface) -> None:
         pass  # For inheritance
@@ -38,8 +89,12 @@ class Screen:
             if event.type == pygame.QUIT:
                 managers.DatabaseManager.get_instance().close()
                 utils.terminate()
-            elif event.type == pygame.KEYDOWN and pygame.key.get_pressed()[pygame.K_ESCAPE]:
+            elif event.type == pygame.KEYDOWN and inputs.is_key_pressed(pygame.K_ESCAPE):
                 self.handle_escape_event()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.frames.toggle()
+            elif event.type in render.expose_events:
+                render.invalidate()
             else:
                 self.handle_event(event)
 
@@ -50,9 +105,19 @@ class Screen:
         managers.DatabaseManager.get_instance().close()
         utils.terminate()
 
-    def update_screen(self, screen: pygame.Surface) -> None:
+    def update_simulation(self) -> None:
+        pass  # For inheritance
+
+    def interpolate(self, alpha: float) -> None:
+        pass  # For inheritance
+
+    def draw_background(self, screen: pygame.Surface) -> None:
+        # Static layer, it is drawn only once per screen change when dirty rendering is used
         screen.fill((0, 0, 0))
-        screen.blit(self.image, self.rect)
+        screen.blit(self.get_image(), (0, 0))
+
+    def update_screen(self, screen: pygame.Surface) -> None:
+        pass  # For inheritance
 
     def loop_post(self, elapsed: float) -> None:
         pass  # For inheritance
@@ -60,93 +125,165 @@ class Screen:
     @classmethod
     def get_image(cls) -> pygame.Surface:
         if not cls.image:
-            screen_name = utils.to_snake_case(cls.__name__)
-            cls.image = pygame.transform.scale(
-                utils.load_image(f'screens/{screen_name}/{screen_name}.png'),
-                (config.width, config.height)
-            )
+            path = cls.get_image_path()
+            image = cache.map_image(path)
+            if image is None:
+                image = utils.scale_image(utils.load_image(path), (config.width, config.height))
+            cls.image = surfaces.prepare(image, surfaces.OPAQUE)
+            surfaces.register(path, surfaces.OPAQUE, [cls.image])
         return cls.image
 
+    @classmethod
+    def evict(cls) -> None:
+        # Called when the screen is left. A mapped background gives its memory back, a decoded one is kept,
+        # since decoding it again would stall the next screen change
+        cache.evict(cls.get_image_path())
+
+    @classmethod
+    def get_image_path(cls) -> str:
+        screen_name = utils.to_snake_case(cls.__name__)
+        return f'screens/{screen_name}/{screen_name}.png'
+
 
 class Loading(Screen):
+    bar_rect = pygame.Rect(config.width // 4, config.height - config.height // 8, config.width // 2, 12)
+
     def __init__(self):
         super().__init__()
-        self.elapsed = 0.0
+        self.loader = None
 
     def loop_pre(self, screen: pygame.Surface):
-        if self.elapsed >= 2.0:
-            self.elapsed = 0.0
+        if self.loader is None:
+            self.loader = self.create_loader()
+        elif self.loader.is_done():
             managers.ScreensManager.set_next_screen(MainMenu)
 
+    def create_loader(self) -> assets.Loader:
+        screen_classes = [screen for screen in managers.ScreensManager.screen_dictionary if screen is not Quit]
+        images, sounds_paths = assets.get_manifest(screen.get_image_path() for screen in screen_classes)
+        bank = managers.SoundsManager.get_instance()
+        loader = assets.Loader(images, sounds_paths, bank)
+        loader.add_task(bank.load)
+        for screen in screen_classes:
+            loader.add_task(screen.get_image)
+        loader.add_task(MainMenu.load_images)
+        loader.add_task(sprites.Life.load_images)
+        loader.add_task(sprites.Splash.get_fades)
+        for fruit_class in fruits.Fruit.__subclasses__():
+            loader.add_task(fruit_class.preload)
+        loader.add_task(surfaces.report)
+        loader.add_task(self.load_best_scores)
+        loader.start()
+        return loader
+
+    @staticmethod
+    def load_best_scores() -> None:
+        # Opens the database and caches the best scores, so starting a game does not wait for them
+        for screen in (Classic, Arcade):
+            managers.DatabaseManager.get_instance().get_best_score(screen.mode)
+
+    def update_screen(self, screen: pygame.Surface) -> None:
+        progress = self.loader.get_progress() if self.loader else 0.0
+        screen.fill((60, 30, 5), self.bar_rect)
+        filled = self.bar_rect.inflate(-4, -4)
+        filled.w = int(filled.w * progress)
+        screen.fill((200, 100, 10), filled)
+
     def loop_post(self, elapsed: float) -> None:
-        self.elapsed += elapsed
+        # The frame with the progress is already on screen, finish as much as fits until the next one
+        if self.loader:
+            self.loader.poll()
 
 
 class MainMenu(Screen):
     event_change_screen = pygame.USEREVENT + 1
-    music = pygame.mixer.Sound(config.sounds['music'])
 
     logo_part_size = (config.width // 5, config.height // 10)
-    logo_images = {
-        'fruit': pygame.transform.scale(utils.load_image(config.images['fruit_label']), logo_part_size),
-        'mania': pygame.transform.scale(utils.load_image(config.images['mania_label']), logo_part_size),
-    }
-    logo_pos = {
-        'fruit': (config.width // 2 - logo_images['fruit'].get_rect().w, config.height // 10),
-        'mania': (config.width // 2 + 10, config.height // 10)
-    }
+    logo_images: typing.Dict[str, pygame.Surface] = {}
+    logo_pos: typing.Dict[str, typing.Tuple[int, int]] = {}
 
-    ninja_image = utils.load_image(config.images['ninja'])
-    ninja_pos = (
-        config.width // 2 - ninja_image.get_rect().w // 2 + 50,
-        config.height // 2 - ninja_image.get_rect().h // 2
-    )
+    ninja_image: pygame.Surface = 0
+    ninja_pos = (0, 0)
 
-    circles_images = {
-        'classic': utils.crop_image(utils.load_image(config.images['circles'], False), pygame.Rect(1125, 0, 231, 227)),
-        'arcade': utils.crop_image(utils.load_image(config.images['circles'], False), pygame.Rect(16, 242, 200, 200)),
-        'quit': utils.crop_image(utils.load_image(config.images['circles'], False), pygame.Rect(692, 20, 190, 190))
-    }
-    circles_pos = {
-        'classic': circles_images['classic'].get_rect(x=(config.width // 5), y=(config.height // 4)),
-        'arcade': circles_images['arcade'].get_rect(x=(config.width - config.width // 5), y=(config.height // 3)),
-        'quit': circles_images['quit'].get_rect(x=(config.width // 2), y=(config.height - config.height // 3))
+    circles_rect = {
+        'classic': pygame.Rect(1125, 0, 231, 227),
+        'arcade': pygame.Rect(16, 242, 200, 200),
+        'quit': pygame.Rect(692, 20, 190, 190)
     }
+    circles_images: typing.Dict[str, pygame.Surface] = {}
+    circles_pos: typing.Dict[str, pygame.Rect] = {}
 
-    fruits_pos = {
-        'classic': (circles_pos['classic'].x + 56, circles_pos['classic'].y + 56),
-        'arcade': (circles_pos['arcade'].x + 45, circles_pos['arcade'].y + 45),
-        'quit': (circles_pos['quit'].x + 30, circles_pos['quit'].y + 30)
-    }
+    fruits_pos: typing.Dict[str, typing.Tuple[int, int]] = {}
 
     def __init__(self):
         super().__init__()
-        self.circles_images_editable = {
-            'classic': self.circles_images['classic'],
-            'arcade': self.circles_images['arcade'],
-            'quit': self.circles_images['quit']
-        }
-        self.angle = 0
+        self.circles = pygame.sprite.Group()
         self.angle_delta = 0.5 * 1.0 if random.random() else -1.0
         self.next_screen = 0
         self.active = False
+        self.music_channel = None
+
+    @classmethod
+    def load_images(cls) -> None:
+        if cls.logo_images:
+            return
+        cls.logo_images = {
+            'fruit': utils.scale_image(utils.load_image(config.images['fruit_label']), cls.logo_part_size),
+            'mania': utils.scale_image(utils.load_image(config.images['mania_label']), cls.logo_part_size),
+        }
+        cls.logo_pos = {
+            'fruit': (config.width // 2 - cls.logo_images['fruit'].get_rect().w, config.height // 10),
+            'mania': (config.width // 2 + 10, config.height // 10)
+        }
+
+        cls.ninja_image = utils.load_image(config.images['ninja'])
+        cls.ninja_pos = (
+            config.width // 2 - cls.ninja_image.get_rect().w // 2 + 50,
+            config.height // 2 - cls.ninja_image.get_rect().h // 2
+        )
+
+        cls.circles_images = {
+            name: utils.load_region(config.images['circles'], rect, False) for name, rect in cls.circles_rect.items()
+        }
+        surfaces.register('logo', surfaces.ALPHA, list(cls.logo_images.values()) + [cls.ninja_image])
+        cls.circles_pos = {
+            'classic': cls.circles_images['classic'].get_rect(x=(config.width // 5), y=(config.height // 4)),
+            'arcade': cls.circles_images['arcade'].get_rect(
+                x=(config.width - config.width // 5), y=(config.height // 3)
+            ),
+            'quit': cls.circles_images['quit'].get_rect(x=(config.width // 2), y=(config.height - config.height // 3))
+        }
+
+        cls.fruits_pos = {
+            'classic': (cls.circles_pos['classic'].x + 56, cls.circles_pos['classic'].y + 56),
+            'arcade': (cls.circles_pos['arcade'].x + 45, cls.circles_pos['arcade'].y + 45),
+            'quit': (cls.circles_pos['quit'].x + 30, cls.circles_pos['quit'].y + 30)
+        }
 
     def reload(self) -> None:
+        self.load_images()
+        if not self.circles:
+            # Turning by angle_delta every tick
+            self.circles.add(*(
+                sprites.Spinner(
+                    self.get_circle_name(name), image, self.circles_pos[name].center, self.angle_delta * config.tick_rate
+                ) for name, image in self.circles_images.items()
+            ))
         self.active = True
-        self.music.play()
+        self.music_channel = managers.SoundsManager.get_instance().play('music')
         blades.Blade()
 
-        classic_sprite = fruits.RedApple(False)
+        classic_sprite = fruits.RedApple.create(False)
         classic_sprite.personal_gravity = 0
         classic_sprite.move(self.fruits_pos['classic'])
         classic_sprite.screen = Classic
 
-        arcade_sprite = fruits.Banana(False)
+        arcade_sprite = fruits.Banana.create(False)
         arcade_sprite.personal_gravity = 0
         arcade_sprite.move(self.fruits_pos['arcade'])
         arcade_sprite.screen = Arcade
 
-        quit_sprite = fruits.Mango(False)
+        quit_sprite = fruits.Mango.create(False)
         quit_sprite.personal_gravity = 0
         quit_sprite.move(self.fruits_pos['quit'])
         quit_sprite.screen = Quit
@@ -171,17 +308,26 @@ class MainMenu(Screen):
                 self.active = False
                 pygame.time.set_timer(MainMenu.event_change_screen, 1500)
 
-    def update_screen(self, screen: pygame.Surface) -> None:
-        super().update_screen(screen)
-        self.draw_logo(screen)
-        self.draw_ninja(screen)
+    def update_simulation(self) -> None:
         self.update_circles()
-        self.draw_circles(screen)
         singletons.FruitsGroup.get().update()
         singletons.FruitsGroup.get().delete_invisible()
-        singletons.FruitsGroup.get().draw(screen)
         singletons.PartsGroup.get().update()
         singletons.PartsGroup.get().delete_invisible()
+
+    def interpolate(self, alpha: float) -> None:
+        singletons.FruitsGroup.get().interpolate(alpha)
+        singletons.PartsGroup.get().interpolate(alpha)
+
+    def draw_background(self, screen: pygame.Surface) -> None:
+        super().draw_background(screen)
+        self.draw_logo(screen)
+        self.draw_ninja(screen)
+
+    def update_screen(self, screen: pygame.Surface) -> None:
+        super().update_screen(screen)
+        self.draw_circles(screen)
+        singletons.FruitsGroup.get().draw(screen)
         singletons.PartsGroup.get().draw(screen)
         singletons.BladesGroup.get().update(screen)
 
@@ -193,20 +339,23 @@ class MainMenu(Screen):
         screen.blit(self.ninja_image, self.ninja_pos)
 
     def update_circles(self) -> None:
-        for k, v in self.circles_images_editable.items():
-            self.circles_images_editable[k] = pygame.transform.rotate(
-                self.circles_images[k],
-                self.angle
-            ).convert_alpha()
-            self.circles_pos[k] = self.circles_images_editable[k].get_rect(center=self.circles_pos[k].center)
-        self.angle = self.angle + self.angle_delta
+        self.circles.update()
 
     def draw_circles(self, screen: pygame.Surface) -> None:
-        for k, v in self.circles_images_editable.items():
-            screen.blit(self.circles_images_editable[k], self.circles_pos[k])
+        self.circles.draw(screen)
+
+    @classmethod
+    def evict(cls) -> None:
+        # The rotated circles are rendered again while they turn on the next visit
+        super().evict()
+        sprites.Spinner.evict(*(cls.get_circle_name(name) for name in cls.circles_rect))
+
+    @staticmethod
+    def get_circle_name(name: str) -> str:
+        return f'menu circle {name}'
 
     def delete_all(self) -> None:
-        self.music.stop()
+        managers.SoundsManager.get_instance().stop('music', self.music_channel)
         pygame.time.set_timer(MainMenu.event_change_screen, 0)
         singletons.FruitsGroup.get().empty()
         singletons.PartsGroup.get().empty()
@@ -221,9 +370,6 @@ class Classic(Screen):
     event_drop_fruit = pygame.USEREVENT + 3
     event_drop_bomb = pygame.USEREVENT + 4
 
-    sound_game_start = pygame.mixer.Sound(config.sounds['game_start'])
-    sound_lose_life = pygame.mixer.Sound(config.sounds['lose_life'])
-
     fruits_classes = [
         'RedApple',
         'GreenApple',
@@ -247,66 +393,70 @@ class Classic(Screen):
         self.elapsed_blade_session = 0.0
         self.elapsed_critical = 0.0
         self.lives = []
-        self.pause_data = list(utils.create_pause_board())
-        self.pause_info = list(utils.create_pause_info((20, 100)))
+        self.scheduler = scheduler.Scheduler()
+        self.pressed = False
+        self.mouse_pos = None
+        self.effects = effects.ScreenEffects()
+        self.effects.add('blindness', (255, 255, 255))
+        self.pause_data = []
+        self.pause_info = []
+        self.score_text = sprites.HudText((20, 20))
+        self.best_score_text = sprites.HudText((20, 60))
 
     def reload(self) -> None:
         managers.GameManager.get_instance().reload(Classic.mode)
-        pygame.time.set_timer(Classic.event_drop_fruit, int(random.uniform(0.5, 2.0) * 1000))
-        pygame.time.set_timer(Classic.event_drop_bomb, int(random.uniform(10.0, 15.0) * 1000))
-        self.sound_game_start.play()
+        self.pause_data = list(utils.create_pause_board())
+        self.pause_info = list(utils.create_pause_info((20, 100)))
+        self.scheduler.clear()
+        scheduler.rng.seed(replay.start(Classic.mode))
+        telemetry.start(Classic.mode)
+        self.scheduler.set_timer(Classic.event_drop_fruit, int(scheduler.rng.uniform(0.5, 2.0) * 1000))
+        self.scheduler.set_timer(Classic.event_drop_bomb, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
+        managers.SoundsManager.get_instance().play('game_start')
         self.active = True
         self.blindness = 0
         self.elapsed_blade_session = 0.0
         self.elapsed_critical = 0.0
+        self.pressed = False
+        self.mouse_pos = None  # The first tick always counts as a move, whatever the mouse did before
         self.lives = self.create_lives()
         blades.Blade()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == Classic.event_change_screen:
             self.delete_all()
+            replay.stop(managers.GameManager.get_instance().score)
+            telemetry.stop(managers.GameManager.get_instance().score)
             managers.DatabaseManager.get_instance().add_score(managers.GameManager.get_instance().score, Classic.mode)
-            pygame.time.set_timer(Classic.event_change_screen, 0)
+            self.scheduler.set_timer(Classic.event_change_screen, 0)
             managers.ScreensManager.set_next_screen(EndTable)
         if not self.active:
             return
         if event.type == Classic.event_drop_fruit:
-            pygame.time.set_timer(Classic.event_drop_fruit, int(random.uniform(0.5, 2.0) * 1000))
+            self.scheduler.set_timer(Classic.event_drop_fruit, int(scheduler.rng.uniform(0.5, 2.0) * 1000))
             if not managers.GameManager.get_instance().pause:
-                for _ in range(random.randrange(4)):
-                    self.create_fruit(random.choice(Classic.fruits_classes))
+                for _ in range(scheduler.rng.randrange(4)):
+                    self.create_fruit(scheduler.rng.choice(Classic.fruits_classes))
         if event.type == Classic.event_drop_bomb:
-            pygame.time.set_timer(Classic.event_drop_bomb, int(random.uniform(5.0, 7.0) * 1000))
+            self.scheduler.set_timer(Classic.event_drop_bomb, int(scheduler.rng.uniform(5.0, 7.0) * 1000))
             if not managers.GameManager.get_instance().pause:
-                for _ in range(random.randrange(2)):
+                for _ in range(scheduler.rng.randrange(2)):
                     self.create_fruit('Bomb')
-        if not managers.GameManager.get_instance().pause:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    singletons.BladesGroup.get().start_session()
-            if event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:
-                    singletons.BladesGroup.get().end_session()
-            if event.type == pygame.MOUSEMOTION:
-                singletons.BladesGroup.get().add_mouse_track_pos()
-                has_fruit, has_bomb = singletons.BladesGroup.get().check_fruit_cut()
-                if has_fruit and not has_bomb:
-                    managers.GameManager.get_instance().critical_combo += 1
-                    self.elapsed_critical = 0.0
-                if has_bomb:
-                    self.explode_bomb()
-        else:
+        if managers.GameManager.get_instance().pause:
             if event.type == pygame.KEYDOWN:
-                if pygame.key.get_pressed()[pygame.K_LALT]:
-                    pygame.time.set_timer(Classic.event_drop_fruit, 0)
-                    pygame.time.set_timer(Classic.event_drop_bomb, 0)
-                    pygame.time.set_timer(Classic.event_change_screen, 10)
+                if inputs.is_key_pressed(pygame.K_LALT):
+                    self.scheduler.set_timer(Classic.event_drop_fruit, 0)
+                    self.scheduler.set_timer(Classic.event_drop_bomb, 0)
+                    self.scheduler.set_timer(Classic.event_change_screen, 10)
 
     def handle_escape_event(self) -> None:
         managers.GameManager.get_instance().pause = not managers.GameManager.get_instance().pause
 
-    def update_screen(self, screen: pygame.Surface) -> None:
-        super().update_screen(screen)
+    def update_simulation(self) -> None:
+        # Input and timers are handled per tick, so a session plays the same way from its seed and input
+        self.update_input()
+        for event_type in self.scheduler.tick():
+            self.handle_event(pygame.event.Event(event_type))
         self.lose_life(singletons.FruitsGroup.get().delete_invisible())
         if not managers.GameManager.get_instance().pause:
             singletons.SplashesGroup.get().update()
@@ -314,8 +464,42 @@ class Classic(Screen):
             singletons.FruitsGroup.get().update()
             singletons.ScoresGroup.get().update()
             self.update_blindness()
-        singletons.SplashesGroup.get().draw(screen)
         singletons.PartsGroup.get().delete_invisible()
+        self.update_timers(1.0 / config.tick_rate)
+
+    def update_input(self) -> None:
+        game = managers.GameManager.get_instance()
+        pos, pressed, paused = replay.sample(
+            inputs.get_pos(), inputs.get_pressed()[0], game.pause, game.score, len(singletons.FruitsGroup.get())
+        )
+        if paused != game.pause:
+            self.handle_escape_event()  # Replayed pause
+        if not self.active or game.pause:
+            return
+        if pressed != self.pressed:
+            self.pressed = pressed
+            if pressed:
+                singletons.BladesGroup.get().start_session()
+            else:
+                singletons.BladesGroup.get().end_session()
+        if pos != self.mouse_pos:
+            self.mouse_pos = pos
+            singletons.BladesGroup.get().add_mouse_track_pos()
+            has_fruit, has_bomb = singletons.BladesGroup.get().check_fruit_cut()
+            if has_fruit and not has_bomb:
+                game.critical_combo += 1
+                self.elapsed_critical = 0.0
+            if has_bomb:
+                self.explode_bomb()
+
+    def interpolate(self, alpha: float) -> None:
+        if not managers.GameManager.get_instance().pause:
+            singletons.PartsGroup.get().interpolate(alpha)
+            singletons.FruitsGroup.get().interpolate(alpha)
+
+    def update_screen(self, screen: pygame.Surface) -> None:
+        super().update_screen(screen)
+        singletons.SplashesGroup.get().draw(screen)
         singletons.PartsGroup.get().draw(screen)
         singletons.FruitsGroup.get().draw(screen)
         singletons.BladesGroup.get().update(screen)
@@ -329,19 +513,19 @@ class Classic(Screen):
         if managers.GameManager.get_instance().pause:
             utils.draw_pause_board(self.pause_data, screen)
 
-    def loop_post(self, elapsed: float) -> None:
+    def update_timers(self, elapsed: float) -> None:
         if not managers.GameManager.get_instance().pause:
             self.elapsed_blade_session += elapsed
             if self.elapsed_blade_session >= 1.0:
                 self.elapsed_blade_session = 0.0
                 singletons.BladesGroup.get().end_session()
-                if pygame.mouse.get_pressed()[0]:
+                if self.pressed:
                     singletons.BladesGroup.get().start_session()
             self.elapsed_critical += elapsed
             if self.elapsed_critical >= 1.0:
                 if managers.GameManager.get_instance().critical_combo > 3:
-                    sprites.CenteredFruitScore('Critical', managers.GameManager.get_instance().critical_combo * 2)
-                    pygame.mixer.Sound(config.sounds['critical']).play()
+                    sprites.CenteredFruitScore.create('Critical', managers.GameManager.get_instance().critical_combo * 2)
+                    managers.SoundsManager.get_instance().play('critical')
                 self.elapsed_critical = 0.0
                 managers.GameManager.get_instance().critical_combo = 0
 
@@ -351,23 +535,19 @@ class Classic(Screen):
                 self.blindness -= 2
 
     def draw_blindness(self, screen: pygame.Surface) -> None:
-        if self.blindness > 0:
-            surface = pygame.Surface((config.width, config.height))
-            surface = surface.convert_alpha(surface)
-            surface.fill((255, 255, 255, self.blindness))
-            screen.blit(surface, (0, 0))
+        self.effects.set_alpha('blindness', self.blindness)
+        self.effects.draw(screen)
 
     def draw_score(self, screen: pygame.Surface) -> None:
-        font = pygame.font.Font(config.game_font, 30)
-        text = font.render(f'Score: {managers.GameManager.get_instance().score}', 1, (200, 100, 10))
-        screen.blit(text, (20, 20))
+        self.score_text.set_text(f'Score: {managers.GameManager.get_instance().score}')
+        self.score_text.draw(screen)
 
     def draw_best_score(self, screen: pygame.Surface) -> None:
-        font = pygame.font.Font(config.game_font, 30)
-        text = font.render(f'Best: {managers.GameManager.get_instance().best_score}', 1, (200, 100, 10))
-        screen.blit(text, (20, 60))
+        self.best_score_text.set_text(f'Best: {managers.GameManager.get_instance().best_score}')
+        self.best_score_text.draw(screen)
 
-    def create_lives(self) -> typing.List[sprites.Life]:
+    def create_lives(self) -> typing.List['sprites.Life']:
+        sprites.Life.load_images()
         return [
             sprites.Life((config.width - sprites.Life.image_blue.get_rect().w - 20, 20), 0.6),
             sprites.Life((config.width - sprites.Life.image_blue.get_rect().w - 40, 80), 0.8),
@@ -377,32 +557,33 @@ class Classic(Screen):
     def lose_life(self, number: int) -> None:
         while number and self.active:
             if managers.GameManager.get_instance().fruits_missed < 3:
-                self.sound_lose_life.play()
+                managers.SoundsManager.get_instance().play('lose_life')
                 self.lives[managers.GameManager.get_instance().fruits_missed].set_red()
                 managers.GameManager.get_instance().fruits_missed += 1
             if managers.GameManager.get_instance().fruits_missed >= 3:
                 self.active = False
-                pygame.time.set_timer(Classic.event_change_screen, 1500)
+                self.scheduler.set_timer(Classic.event_change_screen, 1500)
             number -= 1
 
     def create_fruit(self, fruit_class: str) -> None:
         if self.active:
-            fruit = getattr(fruits, fruit_class)()
-            x, y = random.randrange(config.width), config.height + 50
+            fruit = getattr(fruits, fruit_class).create()
+            telemetry.add_spawn()
+            x, y = scheduler.rng.randrange(config.width), config.height + 50
             fruit.move((x, y))
-            x_vel = random.randint(100, 400) * (-1 if fruit.rect.x > config.width // 2 else 1)
-            y_vel = random.randint(-1000, -500)
+            x_vel = scheduler.rng.randint(100, 400) * (-1 if fruit.rect.x > config.width // 2 else 1)
+            y_vel = scheduler.rng.randint(-1000, -500)
             fruit.velocity = (x_vel, y_vel)
 
     def explode_bomb(self) -> None:
         self.delete_all()
         self.blindness = 240
         managers.GameManager.get_instance().critical_combo = 0
-        pygame.time.set_timer(Classic.event_change_screen, 1000)
+        self.scheduler.set_timer(Classic.event_change_screen, 1000)
 
     def delete_all(self) -> None:
-        pygame.time.set_timer(Classic.event_drop_fruit, 0)
-        pygame.time.set_timer(Classic.event_drop_bomb, 0)
+        self.scheduler.set_timer(Classic.event_drop_fruit, 0)
+        self.scheduler.set_timer(Classic.event_drop_bomb, 0)
         singletons.FruitsGroup.get().empty()
         singletons.PartsGroup.get().empty()
         singletons.BladesGroup.get().empty()
@@ -421,13 +602,6 @@ class Arcade(Screen):
     event_stop_blitz = pygame.USEREVENT + 5
     event_stop_double = pygame.USEREVENT + 6
 
-    sound_game_start = pygame.mixer.Sound(config.sounds['game_start'])
-    sound_lose_life = pygame.mixer.Sound(config.sounds['lose_life'])
-    sound_freeze = pygame.mixer.Sound(config.sounds['fruit_impact'])
-    sound_blitz = pygame.mixer.Sound(config.sounds['combo_blitz'])
-    sound_blitz_end = pygame.mixer.Sound(config.sounds['combo_blitz_end'])
-    sound_double = pygame.mixer.Sound(config.sounds['double'])
-
     fruits_classes = [
         'RedApple',
         'GreenApple',
@@ -452,19 +626,36 @@ class Arcade(Screen):
         self.elapsed_time = 0.0
         self.elapsed_blade_session = 0.0
         self.elapsed_critical = 0.0
-        self.freeze_screen, self.freeze_text, self.freeze_pos = self.create_freeze()
-        self.blitz_screen, self.blitz_text, self.blitz_pos = self.create_blitz()
-        self.double_screen, self.double_text, self.double_pos = self.create_double()
+        self.freeze_text, self.freeze_pos = self.create_freeze()
+        self.blitz_text, self.blitz_pos = self.create_blitz()
+        self.double_text, self.double_pos = self.create_double()
+        self.effects = effects.ScreenEffects()
+        self.effects.add('blindness', (255, 255, 255))
+        self.effects.add('freeze', (10, 10, 150))
+        self.effects.add('blitz', (10, 10, 10))
+        self.effects.add('double', (100, 10, 150))
         self.freeze_escape_time, self.blitz_escape_time, self.double_escape_time = 0.0, 0.0, 0.0
-        self.pause_data = list(utils.create_pause_board())
-        self.pause_info = list(utils.create_pause_info((20, 100)))
+        self.blitz_channel = None
+        self.scheduler = scheduler.Scheduler()
+        self.pressed = False
+        self.mouse_pos = None
+        self.pause_data = []
+        self.pause_info = []
+        self.score_text = sprites.HudText((20, 20))
+        self.best_score_text = sprites.HudText((20, 60))
+        self.timer_text = sprites.HudText((200, 20))
 
     def reload(self) -> None:
         managers.GameManager.get_instance().reload(Arcade.mode)
-        pygame.time.set_timer(Arcade.event_drop_fruit, int(random.uniform(0.5, 2.0) * 1000))
-        pygame.time.set_timer(Arcade.event_drop_bomb, int(random.uniform(10.0, 15.0) * 1000))
-        pygame.time.set_timer(Arcade.event_drop_sweet, int(random.uniform(10.0, 15.0) * 1000))
-        self.sound_game_start.play()
+        self.pause_data = list(utils.create_pause_board())
+        self.pause_info = list(utils.create_pause_info((20, 100)))
+        self.scheduler.clear()
+        scheduler.rng.seed(replay.start(Arcade.mode))
+        telemetry.start(Arcade.mode)
+        self.scheduler.set_timer(Arcade.event_drop_fruit, int(scheduler.rng.uniform(0.5, 2.0) * 1000))
+        self.scheduler.set_timer(Arcade.event_drop_bomb, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
+        self.scheduler.set_timer(Arcade.event_drop_sweet, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
+        managers.SoundsManager.get_instance().play('game_start')
         self.active = True
         self.blindness = 0
         self.time = config.arcade_time
@@ -472,33 +663,37 @@ class Arcade(Screen):
         self.elapsed_blade_session = 0.0
         self.elapsed_critical = 0.0
         self.freeze_escape_time, self.blitz_escape_time, self.double_escape_time = 0.0, 0.0, 0.0
+        self.pressed = False
+        self.mouse_pos = None  # The first tick always counts as a move, whatever the mouse did before
         blades.Blade()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == Arcade.event_change_screen:
             self.delete_all()
+            replay.stop(managers.GameManager.get_instance().score)
+            telemetry.stop(managers.GameManager.get_instance().score)
             managers.DatabaseManager.get_instance().add_score(managers.GameManager.get_instance().score, Arcade.mode)
-            pygame.time.set_timer(Arcade.event_change_screen, 0)
+            self.scheduler.set_timer(Arcade.event_change_screen, 0)
             managers.ScreensManager.set_next_screen(EndTable)
         if not self.active:
             return
         if event.type == Arcade.event_drop_fruit:
             if managers.GameManager.get_instance().blitz:
-                pygame.time.set_timer(Arcade.event_drop_fruit, int(0.3 * 1000))
+                self.scheduler.set_timer(Arcade.event_drop_fruit, int(0.3 * 1000))
             else:
-                pygame.time.set_timer(Arcade.event_drop_fruit, int(random.uniform(0.5, 2.0) * 1000))
+                self.scheduler.set_timer(Arcade.event_drop_fruit, int(scheduler.rng.uniform(0.5, 2.0) * 1000))
             if not managers.GameManager.get_instance().pause:
-                for _ in range(random.randrange(4)):
-                    self.create_fruit(random.choice(Arcade.fruits_classes))
+                for _ in range(scheduler.rng.randrange(4)):
+                    self.create_fruit(scheduler.rng.choice(Arcade.fruits_classes))
         if event.type == Arcade.event_drop_bomb:
-            pygame.time.set_timer(Arcade.event_drop_bomb, int(random.uniform(3.0, 7.0) * 1000))
+            self.scheduler.set_timer(Arcade.event_drop_bomb, int(scheduler.rng.uniform(3.0, 7.0) * 1000))
             if not managers.GameManager.get_instance().pause:
-                for _ in range(random.randrange(3)):
+                for _ in range(scheduler.rng.randrange(3)):
                     self.create_fruit('Bomb')
         if event.type == Arcade.event_drop_sweet:
-            pygame.time.set_timer(Arcade.event_drop_sweet, int(random.uniform(10.0, 15.0) * 1000))
+            self.scheduler.set_timer(Arcade.event_drop_sweet, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
             if not managers.GameManager.get_instance().pause:
-                n = random.randrange(99)
+                n = scheduler.rng.randrange(99)
                 if n % 2 == 0:
                     self.create_fruit('FrozenApple')
                 elif n % 3 == 0:
@@ -511,55 +706,77 @@ class Arcade(Screen):
             self.set_blitz(False)
         if event.type == Arcade.event_stop_double:
             self.set_double(False)
-        if not managers.GameManager.get_instance().pause:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    singletons.BladesGroup.get().start_session()
-            if event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:
-                    singletons.BladesGroup.get().end_session()
-            if event.type == pygame.MOUSEMOTION:
-                singletons.BladesGroup.get().add_mouse_track_pos()
-                has_fruit, has_bomb = singletons.BladesGroup.get().check_fruit_cut()
-                if has_fruit and not has_bomb:
-                    managers.GameManager.get_instance().critical_combo += 1
-                    self.elapsed_critical = 0.0
-                if has_bomb:
-                    self.explode_bomb()
-        else:
+        if managers.GameManager.get_instance().pause:
             if event.type == pygame.KEYDOWN:
-                if pygame.key.get_pressed()[pygame.K_LALT]:
-                    pygame.time.set_timer(Arcade.event_drop_fruit, 0)
-                    pygame.time.set_timer(Arcade.event_drop_bomb, 0)
-                    pygame.time.set_timer(Arcade.event_change_screen, 10)
+                if inputs.is_key_pressed(pygame.K_LALT):
+                    self.scheduler.set_timer(Arcade.event_drop_fruit, 0)
+                    self.scheduler.set_timer(Arcade.event_drop_bomb, 0)
+                    self.scheduler.set_timer(Arcade.event_change_screen, 10)
 
     def handle_escape_event(self) -> None:
         managers.GameManager.get_instance().pause = not managers.GameManager.get_instance().pause
         if managers.GameManager.get_instance().pause:
-            pygame.time.set_timer(Arcade.event_remove_freeze, 0)
-            pygame.time.set_timer(Arcade.event_stop_double, 0)
-            pygame.time.set_timer(Arcade.event_stop_blitz, 0)
+            self.scheduler.set_timer(Arcade.event_remove_freeze, 0)
+            self.scheduler.set_timer(Arcade.event_stop_double, 0)
+            self.scheduler.set_timer(Arcade.event_stop_blitz, 0)
         else:
-            pygame.time.set_timer(Arcade.event_remove_freeze, int(self.freeze_escape_time * 1000.0))
-            pygame.time.set_timer(Arcade.event_stop_double, int(self.double_escape_time * 1000.0))
-            pygame.time.set_timer(Arcade.event_stop_blitz, int(self.blitz_escape_time * 1000.0))
-
-    def update_screen(self, screen: pygame.Surface) -> None:
-        super().update_screen(screen)
+            self.scheduler.set_timer(Arcade.event_remove_freeze, int(self.freeze_escape_time * 1000.0))
+            self.scheduler.set_timer(Arcade.event_stop_double, int(self.double_escape_time * 1000.0))
+            self.scheduler.set_timer(Arcade.event_stop_blitz, int(self.blitz_escape_time * 1000.0))
+
+    def update_simulation(self) -> None:
+        # Input and timers are handled per tick, so a session plays the same way from its seed and input
+        self.update_input()
+        for event_type in self.scheduler.tick():
+            self.handle_event(pygame.event.Event(event_type))
         if not managers.GameManager.get_instance().pause:
             singletons.SplashesGroup.get().update()
             singletons.PartsGroup.get().update()
             singletons.FruitsGroup.get().update()
             singletons.ScoresGroup.get().update()
             self.update_blindness()
-        singletons.SplashesGroup.get().draw(screen)
         singletons.PartsGroup.get().delete_invisible()
-        singletons.PartsGroup.get().draw(screen)
         singletons.FruitsGroup.get().delete_invisible()
+        self.update_timers(1.0 / config.tick_rate)
+
+    def update_input(self) -> None:
+        game = managers.GameManager.get_instance()
+        pos, pressed, paused = replay.sample(
+            inputs.get_pos(), inputs.get_pressed()[0], game.pause, game.score, len(singletons.FruitsGroup.get())
+        )
+        if paused != game.pause:
+            self.handle_escape_event()  # Replayed pause
+        if not self.active or game.pause:
+            return
+        if pressed != self.pressed:
+            self.pressed = pressed
+            if pressed:
+                singletons.BladesGroup.get().start_session()
+            else:
+                singletons.BladesGroup.get().end_session()
+        if pos != self.mouse_pos:
+            self.mouse_pos = pos
+            singletons.BladesGroup.get().add_mouse_track_pos()
+            has_fruit, has_bomb = singletons.BladesGroup.get().check_fruit_cut()
+            if has_fruit and not has_bomb:
+                game.critical_combo += 1
+                self.elapsed_critical = 0.0
+            if has_bomb:
+                self.explode_bomb()
+
+    def interpolate(self, alpha: float) -> None:
+        if not managers.GameManager.get_instance().pause:
+            singletons.PartsGroup.get().interpolate(alpha)
+            singletons.FruitsGroup.get().interpolate(alpha)
+
+    def update_screen(self, screen: pygame.Surface) -> None:
+        super().update_screen(screen)
+        singletons.SplashesGroup.get().draw(screen)
+        singletons.PartsGroup.get().draw(screen)
         singletons.FruitsGroup.get().draw(screen)
         singletons.BladesGroup.get().update(screen)
         singletons.ScoresGroup.get().draw(screen)
-        self.draw_blindness(screen)
+        self.draw_effects(screen)
         self.draw_freeze(screen)
         self.draw_blitz(screen)
         self.draw_double(screen)
@@ -571,19 +788,19 @@ class Arcade(Screen):
         if managers.GameManager.get_instance().pause:
             utils.draw_pause_board(self.pause_data, screen)
 
-    def loop_post(self, elapsed: float) -> None:
+    def update_timers(self, elapsed: float) -> None:
         if not managers.GameManager.get_instance().pause:
             self.elapsed_blade_session += elapsed
             if self.elapsed_blade_session >= 1.0:
                 self.elapsed_blade_session = 0.0
                 singletons.BladesGroup.get().end_session()
-                if pygame.mouse.get_pressed()[0]:
+                if self.pressed:
                     singletons.BladesGroup.get().start_session()
             self.elapsed_critical += elapsed
             if self.elapsed_critical >= 1.0:
                 if managers.GameManager.get_instance().critical_combo > 3:
-                    sprites.CenteredFruitScore('Critical', managers.GameManager.get_instance().critical_combo * 2)
-                    pygame.mixer.Sound(config.sounds['critical']).play()
+                    sprites.CenteredFruitScore.create('Critical', managers.GameManager.get_instance().critical_combo * 2)
+                    managers.SoundsManager.get_instance().play('critical')
                 self.elapsed_critical = 0.0
                 managers.GameManager.get_instance().critical_combo = 0
             if self.active:
@@ -591,6 +808,9 @@ class Arcade(Screen):
                 if self.elapsed_time >= 1.0:
                     self.time -= 1
                     self.elapsed_time = 0.0
+                if self.time <= 0:
+                    self.active = False
+                    self.scheduler.set_timer(Arcade.event_change_screen, 1500)
             if managers.GameManager.get_instance().freeze:
                 self.freeze_escape_time -= elapsed
             if managers.GameManager.get_instance().double:
@@ -603,128 +823,108 @@ class Arcade(Screen):
             if self.blindness > 0:
                 self.blindness -= 2
 
-    def draw_blindness(self, screen: pygame.Surface) -> None:
-        if self.blindness > 0:
-            surface = pygame.Surface((config.width, config.height))
-            surface = surface.convert_alpha(surface)
-            surface.fill((255, 255, 255, self.blindness))
-            screen.blit(surface, (0, 0))
+    def draw_effects(self, screen: pygame.Surface) -> None:
+        self.effects.set_alpha('blindness', self.blindness)
+        self.effects.set_alpha('freeze', 100 if managers.GameManager.get_instance().freeze else 0)
+        self.effects.set_alpha('blitz', 30 if managers.GameManager.get_instance().blitz else 0)
+        self.effects.set_alpha('double', 30 if managers.GameManager.get_instance().double else 0)
+        self.effects.draw(screen)
 
     def set_freeze(self, enabled: bool) -> None:
         if enabled:
-            pygame.time.set_timer(Arcade.event_drop_sweet, 0)
+            self.scheduler.set_timer(Arcade.event_drop_sweet, 0)
             config.freeze_gravity = config.gravity // 2
             managers.GameManager.get_instance().freeze = True
-            self.sound_freeze.play()
+            managers.SoundsManager.get_instance().play('fruit_impact')
             self.freeze_escape_time = config.arcade_freeze_time / 1000.0
         else:
-            pygame.time.set_timer(Arcade.event_drop_sweet, int(random.uniform(10.0, 15.0) * 1000))
+            self.scheduler.set_timer(Arcade.event_drop_sweet, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
             config.freeze_gravity = 0
             managers.GameManager.get_instance().freeze = False
-            pygame.time.set_timer(Arcade.event_remove_freeze, 0)
+            self.scheduler.set_timer(Arcade.event_remove_freeze, 0)
 
     def create_freeze(self):
-        surface = pygame.Surface((config.width, config.height))
-        surface = surface.convert_alpha(surface)
-        surface.fill((10, 10, 150, 100))
-        font = pygame.font.Font(config.game_font, 60)
-        text = font.render('Freeze Time', 1, (10, 10, 200))
+        text = utils.render_text('Freeze Time', 60, (10, 10, 200))
         pos = (config.width // 2 - text.get_rect().w // 2, config.height // 10)
-        return surface, text, pos
+        return text, pos
 
     def draw_freeze(self, screen: pygame.Surface):
         if managers.GameManager.get_instance().freeze:
-            screen.blit(self.freeze_screen, (0, 0))
             screen.blit(self.freeze_text, self.freeze_pos)
 
     def set_blitz(self, enabled: bool) -> None:
         if enabled:
-            pygame.time.set_timer(Arcade.event_drop_bomb, 0)
-            pygame.time.set_timer(Arcade.event_drop_sweet, 0)
-            pygame.time.set_timer(Arcade.event_drop_fruit, int(0.1 * 1000))
+            self.scheduler.set_timer(Arcade.event_drop_bomb, 0)
+            self.scheduler.set_timer(Arcade.event_drop_sweet, 0)
+            self.scheduler.set_timer(Arcade.event_drop_fruit, int(0.1 * 1000))
             managers.GameManager.get_instance().blitz = True
-            self.sound_blitz.play(-1)
+            self.blitz_channel = managers.SoundsManager.get_instance().play('combo_blitz', -1)
             self.blitz_escape_time = config.arcade_blitz_time / 1000.0
         else:
-            pygame.time.set_timer(Arcade.event_drop_bomb, int(random.uniform(3.0, 7.0) * 1000))
-            pygame.time.set_timer(Arcade.event_drop_sweet, int(random.uniform(10.0, 15.0) * 1000))
-            pygame.time.set_timer(Arcade.event_stop_blitz, 0)
+            self.scheduler.set_timer(Arcade.event_drop_bomb, int(scheduler.rng.uniform(3.0, 7.0) * 1000))
+            self.scheduler.set_timer(Arcade.event_drop_sweet, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
+            self.scheduler.set_timer(Arcade.event_stop_blitz, 0)
             managers.GameManager.get_instance().blitz = False
-            self.sound_blitz.stop()
-            self.sound_blitz_end.play()
+            managers.SoundsManager.get_instance().stop('combo_blitz', self.blitz_channel)
+            managers.SoundsManager.get_instance().play('combo_blitz_end')
 
     def create_blitz(self):
-        surface = pygame.Surface((config.width, config.height))
-        surface = surface.convert_alpha(surface)
-        surface.fill((10, 10, 10, 30))
-        font = pygame.font.Font(config.game_font, 60)
-        text = font.render('Blitz Time', 1, (10, 140, 150))
+        text = utils.render_text('Blitz Time', 60, (10, 140, 150))
         pos = (config.width // 2 - text.get_rect().w // 2, config.height // 9)
-        return surface, text, pos
+        return text, pos
 
     def draw_blitz(self, screen: pygame.Surface):
         if managers.GameManager.get_instance().blitz:
-            screen.blit(self.blitz_screen, (0, 0))
             screen.blit(self.blitz_text, self.blitz_pos)
 
     def set_double(self, enabled: bool) -> None:
         if enabled:
-            pygame.time.set_timer(Arcade.event_drop_sweet, 0)
+            self.scheduler.set_timer(Arcade.event_drop_sweet, 0)
             managers.GameManager.get_instance().double = True
-            self.sound_double.play()
+            managers.SoundsManager.get_instance().play('double')
             self.double_escape_time = config.arcade_double_time / 1000.0
         else:
-            pygame.time.set_timer(Arcade.event_drop_sweet, int(random.uniform(10.0, 15.0) * 1000))
-            pygame.time.set_timer(Arcade.event_stop_double, 0)
+            self.scheduler.set_timer(Arcade.event_drop_sweet, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
+            self.scheduler.set_timer(Arcade.event_stop_double, 0)
             managers.GameManager.get_instance().double = False
 
     def create_double(self):
-        surface = pygame.Surface((config.width, config.height))
-        surface = surface.convert_alpha(surface)
-        surface.fill((100, 10, 150, 30))
-        font = pygame.font.Font(config.game_font, 60)
-        text = font.render('Double Score', 1, (100, 20, 150))
+        text = utils.render_text('Double Score', 60, (100, 20, 150))
         pos = (config.width // 2 - text.get_rect().w // 2, config.height // 8)
-        return surface, text, pos
+        return text, pos
 
     def draw_double(self, screen: pygame.Surface):
         if managers.GameManager.get_instance().double:
-            screen.blit(self.double_screen, (0, 0))
             screen.blit(self.double_text, self.double_pos)
 
     def draw_score(self, screen: pygame.Surface) -> None:
-        font = pygame.font.Font(config.game_font, 30)
-        text = font.render(f'Score: {managers.GameManager.get_instance().score}', 1, (200, 100, 10))
-        screen.blit(text, (20, 20))
+        self.score_text.set_text(f'Score: {managers.GameManager.get_instance().score}')
+        self.score_text.draw(screen)
 
     def draw_best_score(self, screen: pygame.Surface) -> None:
-        font = pygame.font.Font(config.game_font, 30)
-        text = font.render(f'Best: {managers.GameManager.get_instance().best_score}', 1, (200, 100, 10))
-        screen.blit(text, (20, 60))
+        self.best_score_text.set_text(f'Best: {managers.GameManager.get_instance().best_score}')
+        self.best_score_text.draw(screen)
 
     def draw_timer(self, screen: pygame.Surface) -> None:
-        font = pygame.font.Font(config.game_font, 30)
         minutes = int((self.time % 3600) / 60)
         seconds = int(self.time % 60)
-        text = font.render(f'{minutes}:{str(seconds).rjust(2, "0")}', 1, (200, 100, 10))
-        screen.blit(text, (200, 20))
-        if not minutes and not seconds and self.active:
-            self.active = False
-            pygame.time.set_timer(Arcade.event_change_screen, 1500)
+        self.timer_text.set_text(f'{minutes}:{str(seconds).rjust(2, "0")}')
+        self.timer_text.draw(screen)
 
     def create_fruit(self, fruit_class: str) -> None:
         if self.active:
-            fruit = getattr(fruits, fruit_class)()
+            fruit = getattr(fruits, fruit_class).create()
+            telemetry.add_spawn()
             if managers.GameManager.get_instance().blitz:
-                x, y = -100 if random.randrange(2) else config.width + 50, config.height // 2
+                x, y = -100 if scheduler.rng.randrange(2) else config.width + 50, config.height // 2
                 fruit.move((x, y))
-                x_vel = random.randint(300, 400) * (-1 if fruit.rect.x > config.width // 2 else 1)
-                y_vel = random.randint(-300, -200)
+                x_vel = scheduler.rng.randint(300, 400) * (-1 if fruit.rect.x > config.width // 2 else 1)
+                y_vel = scheduler.rng.randint(-300, -200)
             else:
-                x, y = random.randrange(config.width), config.height + 1
+                x, y = scheduler.rng.randrange(config.width), config.height + 1
                 fruit.move((x, y))
-                x_vel = random.randint(100, 400) * (-1 if fruit.rect.x > config.width // 2 else 1)
-                y_vel = random.randint(-700, -500)
+                x_vel = scheduler.rng.randint(100, 400) * (-1 if fruit.rect.x > config.width // 2 else 1)
+                y_vel = scheduler.rng.randint(-700, -500)
             if managers.GameManager.get_instance().freeze:
                 x_vel = math.ceil(x_vel / (config.gravity / config.freeze_gravity))
                 y_vel = math.ceil(y_vel / (config.gravity / config.freeze_gravity))
@@ -734,21 +934,22 @@ class Arcade(Screen):
         self.clear_sprites()
         self.blindness = 240
         managers.GameManager.get_instance().critical_combo = 0
-        pygame.time.set_timer(Arcade.event_drop_fruit, int(random.uniform(7.0, 8.0) * 1000))
-        pygame.time.set_timer(Arcade.event_drop_bomb, int(random.uniform(7.0, 8.0) * 1000))
-        pygame.time.set_timer(Arcade.event_drop_sweet, int(random.uniform(10.0, 15.0) * 1000))
-        pygame.time.set_timer(Arcade.event_remove_freeze, 1)
+        self.scheduler.set_timer(Arcade.event_drop_fruit, int(scheduler.rng.uniform(7.0, 8.0) * 1000))
+        self.scheduler.set_timer(Arcade.event_drop_bomb, int(scheduler.rng.uniform(7.0, 8.0) * 1000))
+        self.scheduler.set_timer(Arcade.event_drop_sweet, int(scheduler.rng.uniform(10.0, 15.0) * 1000))
+        self.scheduler.set_timer(Arcade.event_remove_freeze, 1)
 
     def clear_sprites(self):
         singletons.FruitsGroup.get().empty()
         singletons.PartsGroup.get().empty()
 
     def delete_all(self) -> None:
-        self.sound_blitz.stop()
-        pygame.time.set_timer(Arcade.event_drop_fruit, 0)
-        pygame.time.set_timer(Arcade.event_drop_bomb, 0)
-        pygame.time.set_timer(Arcade.event_drop_sweet, 0)
-        pygame.time.set_timer(Arcade.event_remove_freeze, 1)
+        managers.SoundsManager.get_instance().stop('combo_blitz', self.blitz_channel)
+        self.scheduler.set_timer(Arcade.event_drop_fruit, 0)
+        self.scheduler.set_timer(Arcade.event_drop_bomb, 0)
+        if managers.GameManager.get_instance().freeze:
+            self.set_freeze(False)
+        self.scheduler.clear()
         singletons.FruitsGroup.get().empty()
         singletons.PartsGroup.get().empty()
         singletons.BladesGroup.get().empty()
@@ -758,9 +959,7 @@ class Arcade(Screen):
 
 class EndTable(Screen):
     event_change_screen = pygame.USEREVENT + 1
-    table_image = utils.load_image(config.images['table'])
-    font = pygame.font.Font(config.game_font, 30)
-    sound_game_over = pygame.mixer.Sound(config.sounds['game_over'])
+    table_image: pygame.Surface = 0
 
     def __init__(self):
         super().__init__()
@@ -771,13 +970,16 @@ class EndTable(Screen):
         self.best_score_rect = pygame.Rect(0, 0, 0, 0)
 
     def reload(self) -> None:
-        self.sound_game_over.play()
+        managers.SoundsManager.get_instance().play('game_over')
+        if not EndTable.table_image:
+            EndTable.table_image = utils.load_image(config.images['table'])
+            surfaces.register('table', surfaces.ALPHA, [EndTable.table_image])
         self.table_rect = self.table_image.get_rect(center=(config.width // 2, config.height // 2))
-        self.score_image = self.font.render(
-            f'Total: {managers.GameManager.get_instance().score}', 1, (200, 100, 10)
+        self.score_image = utils.render_text(
+            f'Total: {managers.GameManager.get_instance().score}', 30, (200, 100, 10)
         )
-        self.best_score_image = self.font.render(
-            f'Best score: {managers.GameManager.get_instance().best_score}', 1, (200, 100, 10)
+        self.best_score_image = utils.render_text(
+            f'Best score: {managers.GameManager.get_instance().best_score}', 30, (200, 100, 10)
         )
         self.score_rect = self.score_image.get_rect(center=self.table_rect.center)
         self.best_score_rect = self.best_score_image.get_rect(center=self.table_rect.center)
@@ -794,8 +996,8 @@ class EndTable(Screen):
     def handle_escape_event(self) -> None:
         pygame.time.set_timer(EndTable.event_change_screen, 1000)
 
-    def update_screen(self, screen: pygame.Surface) -> None:
-        super().update_screen(screen)
+    def draw_background(self, screen: pygame.Surface) -> None:
+        super().draw_background(screen)
         self.draw_table(screen)
         self.draw_score(screen)
 
@@ -1,22 +1,109 @@
 import sys
+import typing
 import pygame
+import inputs
 import fruits
+import physics
+import profiler
+import spatial
 import config
 
 
 class _Group(pygame.sprite.Group):
+    def __init__(self, *sprites):
+        super().__init__(*sprites)
+        # Phase of the frame profiler
+        self.draw_phase = f'{self.__class__.__name__.lstrip("_")}.draw'
+
+    def draw(self, surface, *args, **kwargs):
+        return profiler.frames.call(self.draw_phase, super().draw, surface, *args, **kwargs)
+
     def empty(self):
         for sprite in self.sprites():
             sprite.kill()
         super().empty()
 
 
-class _FruitsGroup(_Group):
-    def delete_invisible(self) -> int:
+class _PhysicsGroup(_Group):
+    def __init__(self, *sprites):
+        self.engine = physics.Engine() if physics.is_enabled() else None
+        # Of the bounds at the current tick. The engine finds sprites by its arrays instead
+        self.index = spatial.SpatialHash() if not self.engine else None
+        super().__init__(*sprites)
+        # Sub-steps of the frame profiler's update_simulation and interpolate phases
+        name = self.__class__.__name__.lstrip('_')
+        self.update_phase = f'{name}.update'
+        self.cull_phase = f'{name}.delete_invisible'
+        self.interpolate_phase = f'{name}.interpolate'
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if self.engine:
+            self.engine.add(sprite)
+        else:
+            self.index.insert(sprite, sprite.get_tick_bounds())
+            sprite.spatial_index = self.index
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if self.engine:
+            self.engine.remove(sprite)
+        else:
+            self.index.remove(sprite)
+            sprite.spatial_index = None
+
+    def update(self, *args, **kwargs):
+        profiler.frames.call(self.update_phase, self.step, *args, **kwargs)
+
+    def step(self, *args, **kwargs):
+        if self.engine:
+            self.engine.step()
+        else:
+            super().update(*args, **kwargs)
+            for sprite in self.sprites():
+                self.index.update(sprite, sprite.get_tick_bounds())
+
+    def delete_invisible(self):
+        return profiler.frames.call(self.cull_phase, self.cull)
+
+    def cull(self):
+        pass  # For inheritance, kills the sprites that left the screen
+
+    def interpolate(self, alpha: float) -> None:
+        profiler.frames.call(self.interpolate_phase, self.interpolate_sprites, alpha)
+
+    def interpolate_sprites(self, alpha: float) -> None:
+        # Drawing only, the simulation does not read the interpolated rects
+        if self.engine:
+            self.engine.interpolate(alpha)
+        else:
+            for sprite in self.sprites():
+                sprite.interpolate(alpha)
+
+    def query(self, rect: pygame.Rect) -> typing.List[pygame.sprite.Sprite]:
+        # Sprites whose bounds at the current tick collide with the rect
+        if self.engine:
+            return self.engine.query(rect)
+        return [sprite for sprite in self.index.query(rect) if rect.colliderect(sprite.get_tick_bounds())]
+
+    def get_culling_candidates(self) -> typing.Iterable[pygame.sprite.Sprite]:
+        return self.index.query_outside(pygame.Rect(0, 0, config.width, config.height))
+
+
+class _FruitsGroup(_PhysicsGroup):
+    def cull(self) -> int:
         number = 0
-        for fruit in self.sprites():
+        if self.engine:
+            # Out of the engine at once, the kills then have nothing left to remove from it
+            for fruit in self.engine.remove_many(self.engine.get_invisible()):
+                if not isinstance(fruit, fruits.Bomb):
+                    number += 1
+                fruit.kill()
+            return number
+        for fruit in self.get_culling_candidates():
+            bounds = fruit.get_tick_bounds()
             # Верхнюю границу пересекать может, т.к. под силой тяжести все равно упадет
-            if not (-fruit.rect.w < fruit.rect.x < config.width) or fruit.rect.y > config.height:
+            if not (-bounds.w < bounds.x < config.width) or bounds.y > config.height:
                 x, y = fruit.velocity
                 if y > 0:
                     if not isinstance(fruit, fruits.Bomb):
@@ -29,11 +116,16 @@ class _FruitsGroup(_Group):
             fruit.kill()
 
 
-class _PartsGroup(_Group):
-    def delete_invisible(self):
-        for part in self.sprites():
+class _PartsGroup(_PhysicsGroup):
+    def cull(self):
+        if self.engine:
+            for part in self.engine.remove_many(self.engine.get_invisible()):
+                part.kill()
+            return
+        for part in self.get_culling_candidates():
+            bounds = part.get_tick_bounds()
             # Верхнюю границу пересекать может, т.к. под силой тяжести все равно упадет
-            if not (-part.rect.w < part.rect.x < config.width) or part.rect.y > config.height:
+            if not (-bounds.w < bounds.x < config.width) or bounds.y > config.height:
                 x, y = part.velocity
                 if y > 0:
                     part.kill()
@@ -44,6 +136,10 @@ class _PartsGroup(_Group):
 
 
 class _BladesGroup(_Group):
+    def update(self, *args, **kwargs):
+        # Blades are updated while the screen is drawn, with their particles
+        profiler.frames.call('BladesGroup.update', super().update, *args, **kwargs)
+
     def start_session(self):
         for blade in self.sprites():
             blade.session_started = True
@@ -54,23 +150,21 @@ class _BladesGroup(_Group):
 
     def add_mouse_track_pos(self):
         for blade in self.sprites():
-            blade.add_mouse_track_pos(pygame.mouse.get_pos())
+            blade.add_mouse_track_pos(inputs.get_pos())
 
     # Specially for MainMenu (for getting screen which is connected to our fruit)
     def check_fruit_screen(self):
         for blade in self.sprites():
             if blade.session_started:
-                fruit = pygame.sprite.spritecollideany(blade, FruitsGroup.get())
-                if fruit:
-                    if hasattr(fruit, 'screen'):
-                        return getattr(fruit, 'screen')
+                for fruit in blade.get_swept_fruits(FruitsGroup.get()):
+                    if fruit.screen:
+                        return fruit.screen
 
     def check_fruit_cut(self):
         has_fruit, has_bomb = False, False
         for blade in self.sprites():
             if blade.session_started:
-                fruit = pygame.sprite.spritecollideany(blade, FruitsGroup.get(), pygame.sprite.collide_mask)
-                if fruit:
+                for fruit in blade.get_swept_fruits(FruitsGroup.get()):
                     blade.add_cut_fruit(fruit)
                     if isinstance(fruit, fruits.Bomb):
                         has_bomb = True
@@ -91,11 +185,12 @@ class _SplashesGroup(_Group):
 
 
 class Group:
-    group: pygame.sprite.Group = 0
+    group: typing.Optional[pygame.sprite.Group] = None
 
     @classmethod
     def get(cls):
-        if not cls.group:
+        # An empty group is falsy, so it is tested for None to not be created again while it is empty
+        if cls.group is None:
             cls.group = getattr(sys.modules[cls.__module__], f'_{cls.__name__}')()
         return cls.group
 
@@ -0,0 +1,63 @@
+import typing
+import pygame
+import config
+
+
+# When all channels are busy, a sound takes over the channel of the lowest lower priority sound
+class SoundBank:
+    def __init__(self, channels: int = config.sound_channels):
+        self.channels_number = channels
+        self.sounds: typing.Dict[str, pygame.mixer.Sound] = {}
+        self.channels: typing.List[pygame.mixer.Channel] = []
+        self.priorities: typing.List[int] = []
+
+    def load(self) -> None:
+        if self.channels:
+            return
+        pygame.mixer.set_num_channels(self.channels_number)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.channels_number)]
+        self.priorities = [0] * self.channels_number
+        # Sounds already decoded by the loading screen are not decoded again
+        for name, path in config.sounds.items():
+            if name not in self.sounds:
+                self.sounds[name] = pygame.mixer.Sound(path)
+
+    def add(self, name: str, sound: pygame.mixer.Sound) -> None:
+        self.sounds[name] = sound
+
+    def get(self, name: str) -> pygame.mixer.Sound:
+        self.load()
+        return self.sounds[name]
+
+    def get_channel(self, priority: int) -> typing.Optional[pygame.mixer.Channel]:
+        lowest = -1
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return channel
+            if self.priorities[i] < priority and (lowest == -1 or self.priorities[i] < self.priorities[lowest]):
+                lowest = i
+        return self.channels[lowest] if lowest != -1 else None
+
+    def play(
+            self, name: str, loops: int = 0, volume: float = 1.0, priority: typing.Optional[int] = None
+    ) -> typing.Optional[pygame.mixer.Channel]:
+        sound = self.get(name)
+        if priority is None:
+            priority = config.sound_priorities.get(name, 0)
+        channel = self.get_channel(priority)
+        if channel is None:
+            return None
+        channel.play(sound, loops)
+        channel.set_volume(volume)
+        self.priorities[self.channels.index(channel)] = priority
+        return channel
+
+    def stop(self, name: str, channel: typing.Optional[pygame.mixer.Channel] = None) -> None:
+        sound = self.get(name)
+        if channel is None:
+            sound.stop()
+        elif channel.get_sound() is sound:
+            channel.stop()
+
+    def get_busy_channels(self) -> int:
+        return sum(1 for channel in self.channels if channel.get_busy())
@@ -0,0 +1,64 @@
+import typing
+import pygame
+import config
+
+
+class SpatialHash:
+    def __init__(self, cell_size: int = config.spatial_cell_size):
+        self.cell_size = cell_size
+        self.cells: typing.Dict[typing.Tuple[int, int], typing.Set[pygame.sprite.Sprite]] = {}
+        self.ranges: typing.Dict[pygame.sprite.Sprite, typing.Tuple[int, int, int, int]] = {}
+
+    def get_range(self, rect: pygame.Rect) -> typing.Tuple[int, int, int, int]:
+        size = self.cell_size
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    def insert(self, sprite: pygame.sprite.Sprite, rect: pygame.Rect) -> None:
+        cells_range = self.get_range(rect)
+        self.ranges[sprite] = cells_range
+        x1, y1, x2, y2 = cells_range
+        for x in range(x1, x2 + 1):
+            for y in range(y1, y2 + 1):
+                self.cells.setdefault((x, y), set()).add(sprite)
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        cells_range = self.ranges.pop(sprite, None)
+        if cells_range is None:
+            return
+        x1, y1, x2, y2 = cells_range
+        for x in range(x1, x2 + 1):
+            for y in range(y1, y2 + 1):
+                cell = self.cells[(x, y)]
+                cell.discard(sprite)
+                if not cell:
+                    del self.cells[(x, y)]
+
+    def update(self, sprite: pygame.sprite.Sprite, rect: pygame.Rect) -> None:
+        # Most moves stay within the same cells, then nothing has to be done
+        if self.ranges.get(sprite) != self.get_range(rect):
+            self.remove(sprite)
+            self.insert(sprite, rect)
+
+    def query(self, rect: pygame.Rect) -> typing.Set[pygame.sprite.Sprite]:
+        found = set()
+        x1, y1, x2, y2 = self.get_range(rect)
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > len(self.cells):
+            cells = (cell for (x, y), cell in self.cells.items() if x1 <= x <= x2 and y1 <= y <= y2)
+        else:
+            cells = (self.cells.get((x, y), ()) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1))
+        for cell in cells:
+            found.update(cell)
+        return found
+
+    def query_outside(self, rect: pygame.Rect) -> typing.Set[pygame.sprite.Sprite]:
+        # Sprites in cells that are not fully inside the rect
+        found = set()
+        size = self.cell_size
+        for (x, y), cell in self.cells.items():
+            if not rect.contains((x * size, y * size, size, size)):
+                found.update(cell)
+        return found
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.ranges.clear()
@@ -1,31 +1,81 @@
-import random
+import typing
+import functools
 import pygame
+import inputs
 import managers
+import objects
+import pools
+import scheduler
 import singletons
+import surfaces
 import utils
 import config
 
 
+# Alpha variants of an image, subsurfaces that share its pixels
+class FadeFrames:
+    def __init__(self, image: pygame.Surface, steps: int = config.fade_steps):
+        self.image = image
+        self.steps = steps
+        self.images: typing.List[typing.Optional[pygame.Surface]] = [None] * steps
+        self.images[-1] = image  # Opaque, the image itself
+
+    def get_index(self, alpha: int) -> int:
+        return max(0, min(round(alpha * (self.steps - 1) / 255), self.steps - 1))
+
+    def get(self, alpha: int) -> pygame.Surface:
+        index = self.get_index(alpha)
+        if self.images[index] is None:
+            image = self.image.subsurface(self.image.get_rect())
+            surfaces.set_alpha(image, round(index * 255 / (self.steps - 1)))
+            self.images[index] = image
+        return self.images[index]
+
+
+@functools.lru_cache(maxsize=config.text_cache_size)
+def get_text_fade(text: str, size: int, color: tuple) -> FadeFrames:
+    # Shared by the score popups showing the same text
+    return FadeFrames(utils.render_text(text, size, color, False))
+
+
 class AlphaAnimatedSprite(pygame.sprite.Sprite):
-    def __init__(self, *groups):
-        super().__init__(*groups)
+    fade_time = config.fade_time  # In seconds, from opaque to gone
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
         self.image: pygame.Surface = pygame.Surface((0, 0))
+        self.fade: typing.Optional[FadeFrames] = None
+        self.alpha = 255
+        self.elapsed = 0.0
+        self.reset(*args, **kwargs)
+
+    def reset(self, *groups):
+        # Subclasses set fade, and their image from it
         self.alpha = 255
+        self.elapsed = 0.0
+        self.add(*groups)
 
     def update(self, *args):
-        if self.alpha <= 0:
+        # Once per simulation tick, so the fade takes the same time whatever the frame rate
+        self.elapsed += 1.0 / config.tick_rate
+        if self.elapsed >= self.fade_time:
             self.kill()
-        self.alpha -= 2
-        self.image.set_alpha(self.alpha)
+            return
+        self.alpha = round(255 * (1.0 - self.elapsed / self.fade_time))
+        self.image = self.fade.get(self.alpha)
 
 
 class Life(pygame.sprite.Sprite):
-    life_sprites = utils.load_image(config.images['lives'])
-    image_blue = utils.crop_image(life_sprites, pygame.Rect(6, 2, 88, 84))
-    image_red = utils.crop_image(life_sprites, pygame.Rect(6, 90, 88, 84))
+    sprite_rect = {
+        'blue': pygame.Rect(6, 2, 88, 84),
+        'red': pygame.Rect(6, 90, 88, 84)
+    }
+    image_blue: pygame.Surface = 0
+    image_red: pygame.Surface = 0
 
     def __init__(self, pos, scale, *groups):
         super().__init__(singletons.LivesGroup.get(), *groups)
+        self.load_images()
         self.scale = scale
         self.image = pygame.transform.scale(Life.image_blue, (
             int(Life.image_blue.get_rect().w * scale),
@@ -40,29 +90,56 @@ class Life(pygame.sprite.Sprite):
             int(Life.image_blue.get_rect().h * self.scale))
         )
 
+    @classmethod
+    def load_images(cls) -> None:
+        if not cls.image_blue:
+            cls.image_blue = utils.load_region(config.images['lives'], cls.sprite_rect['blue'])
+            cls.image_red = utils.load_region(config.images['lives'], cls.sprite_rect['red'])
+            surfaces.register('lives', surfaces.COLORKEY, [cls.image_blue, cls.image_red])
 
-class FruitScore(AlphaAnimatedSprite):
-    def __init__(self, text, score, pos, size=30, *groups):
-        super().__init__(singletons.ScoresGroup.get(), *groups)
+
+class HudText(pygame.sprite.Sprite):
+    def __init__(self, pos, size=30, color=(200, 100, 10), *groups):
+        super().__init__(*groups)
+        self.pos = pos
+        self.size = size
+        self.color = color
+        self.text = None
+        self.image = pygame.Surface((0, 0))
+        self.rect = self.image.get_rect(topleft=pos)
+
+    def set_text(self, text: str) -> None:
+        if text != self.text:
+            self.text = text
+            self.image = utils.render_text(text, self.size, self.color)
+            self.rect = self.image.get_rect(topleft=self.pos)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blit(self.image, self.rect)
+
+
+class FruitScore(pools.Poolable, AlphaAnimatedSprite):
+    def reset(self, text, score, pos, size=30, *groups):
+        super().reset(singletons.ScoresGroup.get(), *groups)
         self.font_size = size
         self.text = text
         self.score = score
-        self.image = self.get_image()
+        self.fade = self.get_fade()
+        self.image = self.fade.get(self.alpha)
         self.rect = self.image.get_rect(center=pos)
 
-    def get_image(self):
+    def get_fade(self) -> FadeFrames:
         managers.GameManager.get_instance().score += self.score
-        font = pygame.font.Font(config.game_font, self.font_size)
         if self.score >= 0:
             text = f'{self.text}: {abs(self.score)} points'
         else:
             text = f'{self.text}: -{abs(self.score)} points'
-        return font.render(text, 0, (200, 100, 10))
+        return get_text_fade(text, self.font_size, (200, 100, 10))
 
 
 class MouseFruitScore(FruitScore):
-    def __init__(self, text, score, size=30, *groups):
-        super().__init__(text, score, pygame.mouse.get_pos(), size, *groups)
+    def reset(self, text, score, size=30, *groups):
+        super().reset(text, score, inputs.get_pos(), size, *groups)
 
 
 class CenteredFruitScore(FruitScore):
@@ -75,26 +152,89 @@ class CenteredFruitScore(FruitScore):
         (config.width // 2 + config.width // 5, config.height // 2 + config.height // 5),
     ]
 
-    def __init__(self, text, score, size=50, *groups):
-        super().__init__(text, score, self.positions[CenteredFruitScore.timer], size, *groups)
+    def reset(self, text, score, size=50, *groups):
+        super().reset(text, score, self.positions[CenteredFruitScore.timer], size, *groups)
         CenteredFruitScore.timer = (CenteredFruitScore.timer + 1) % len(CenteredFruitScore.positions)
 
 
-class Splash(AlphaAnimatedSprite):
-    image = utils.load_image(config.images['splashes'], False)
-    cropped_images = [
-        utils.crop_image(image, pygame.Rect(15, 13, 169, 180)),
-        utils.crop_image(image, pygame.Rect(205, 10, 185, 188)),
-        utils.crop_image(image, pygame.Rect(10, 207, 196, 180)),
-        utils.crop_image(image, pygame.Rect(202, 208, 195, 183)),
-        utils.crop_image(image, pygame.Rect(397, 7, 198, 189)),
-        utils.crop_image(image, pygame.Rect(598, 11, 202, 189)),
-        utils.crop_image(image, pygame.Rect(387, 211, 224, 182)),
-        utils.crop_image(image, pygame.Rect(610, 205, 185, 191))
+class Splash(pools.Poolable, AlphaAnimatedSprite):
+    sprite_rect = [
+        pygame.Rect(15, 13, 169, 180),
+        pygame.Rect(205, 10, 185, 188),
+        pygame.Rect(10, 207, 196, 180),
+        pygame.Rect(202, 208, 195, 183),
+        pygame.Rect(397, 7, 198, 189),
+        pygame.Rect(598, 11, 202, 189),
+        pygame.Rect(387, 211, 224, 182),
+        pygame.Rect(610, 205, 185, 191)
     ]
+    cropped_images: typing.List[pygame.Surface] = []
+    fades: typing.List[FadeFrames] = []
 
-    def __init__(self, pos, *groups):
-        super().__init__(singletons.SplashesGroup.get(), *groups)
-        self.image = random.choice(self.cropped_images)
+    def reset(self, pos, *groups):
+        super().reset(singletons.SplashesGroup.get(), *groups)
+        self.fade = scheduler.rng.choice(self.get_fades())
+        self.image = self.fade.get(self.alpha)
         self.rect = self.image.get_rect()
         self.rect.x, self.rect.y = pos
+
+    @classmethod
+    def get_cropped_images(cls) -> typing.List[pygame.Surface]:
+        if not cls.cropped_images:
+            cls.cropped_images = [
+                utils.load_region(config.images['splashes'], rect, False, surfaces.FADING) for rect in cls.sprite_rect
+            ]
+            surfaces.register('splashes', surfaces.FADING, cls.cropped_images)
+        return cls.cropped_images
+
+    @classmethod
+    def get_fades(cls) -> typing.List[FadeFrames]:
+        if not cls.fades:
+            cls.fades = [FadeFrames(image) for image in cls.get_cropped_images()]
+        return cls.fades
+
+
+# Turns by speed degrees per second, the frames of all spinners share config.spinner_memory
+class Spinner(pygame.sprite.Sprite):
+    atlases: typing.Dict[str, objects.RotationAtlas] = {}
+
+    def __init__(self, name: str, image: pygame.Surface, center: typing.Tuple[int, int], speed: float, *groups):
+        super().__init__(*groups)
+        self.atlas = self.get_atlas(name, image)
+        self.center = center
+        self.speed = speed
+        self.angle = 0.0
+        self.image = image
+        self.rect = image.get_rect(center=center)
+        self.turn(0.0)
+
+    def update(self, *args):
+        # Once per simulation tick
+        self.turn(self.speed / config.tick_rate)
+
+    def turn(self, degrees: float) -> None:
+        self.angle = (self.angle + degrees) % 360
+        frame = self.atlas.images[self.atlas.get_index(self.angle)]
+        if frame is None or frame is not self.image:
+            self.image = self.atlas.get(self.angle)[0]
+            self.rect = self.image.get_rect(center=self.center)
+
+    @classmethod
+    def get_steps(cls) -> int:
+        revolution = sum(objects.RotationAtlas.get_frame_size(atlas.image, False) for atlas in cls.atlases.values())
+        return max(1, min(config.spinner_steps, int(config.spinner_memory // revolution)))
+
+    @classmethod
+    def get_atlas(cls, name: str, image: pygame.Surface) -> objects.RotationAtlas:
+        if name not in cls.atlases:
+            cls.atlases[name] = objects.RotationAtlas(image, 1, name, with_masks=False)
+            steps = cls.get_steps()
+            for atlas in cls.atlases.values():
+                atlas.set_steps(steps)
+        return cls.atlases[name]
+
+    @classmethod
+    def evict(cls, *names: str) -> None:
+        for name in names:
+            if name in cls.atlases:
+                cls.atlases[name].clear()
@@ -0,0 +1,104 @@
+import sys
+import typing
+import pygame
+import config
+
+# Blit formats, by the kind of image. Blit costs measured for a fruit region: 6.5 us with a plain colorkey,
+# 2.4 us run-length encoded, 12 us with per-pixel alpha
+OPAQUE = 'opaque'  # Display format without transparency: a plain copy (backgrounds)
+COLORKEY = 'colorkey'  # Display format, black is transparent, run-length encoded: only opaque runs are copied
+FADING = 'fading'  # Colorkey without RLE, for images blitted with a changing surface alpha, which RLE is slower with
+ALPHA = 'alpha'  # Display format with per-pixel alpha (labels, logos, antialiased images)
+
+registered: typing.Dict[str, typing.Tuple[str, typing.List[typing.Optional[pygame.Surface]]]] = {}
+
+
+def is_display_format(surface: pygame.Surface) -> bool:
+    # Same depth and color channels as the display, whatever the alpha channel
+    display = pygame.display.get_surface()
+    if display is None:
+        return True
+    return surface.get_bitsize() == display.get_bitsize() and surface.get_masks()[:3] == display.get_masks()[:3]
+
+
+def is_per_pixel_alpha(surface: pygame.Surface) -> bool:
+    return bool(surface.get_flags() & pygame.SRCALPHA) and surface.get_masks()[3] != 0
+
+
+def flatten(surface: pygame.Surface, color: typing.Tuple[int, int, int] = (0, 0, 0)) -> pygame.Surface:
+    # Drawn over a color in the display format, as utils.crop_image does with the sprite sheets
+    flat = pygame.Surface(surface.get_size()).convert()
+    flat.fill(color)
+    flat.blit(surface, (0, 0))
+    return flat
+
+
+def prepare(surface: pygame.Surface, kind: str, colorkey: typing.Tuple[int, int, int] = (0, 0, 0)) -> pygame.Surface:
+    # Converts the surface once, only when it is not in the display format yet, and sets the flags of the kind
+    if kind == ALPHA:
+        return surface if is_display_format(surface) and is_per_pixel_alpha(surface) else surface.convert_alpha()
+    if is_per_pixel_alpha(surface):
+        surface = flatten(surface, colorkey)
+    elif not is_display_format(surface):
+        surface = surface.convert()
+    surface.set_alpha(None)
+    if kind == OPAQUE:
+        surface.set_colorkey(None)
+    else:
+        surface.set_colorkey(colorkey, pygame.RLEACCEL if kind == COLORKEY else 0)
+    return surface
+
+
+def get_kind(surface: pygame.Surface) -> str:
+    # Of a prepared surface, so that surfaces made from it (rotated, scaled) are prepared the same way
+    if is_per_pixel_alpha(surface):
+        return ALPHA
+    if surface.get_colorkey() is None:
+        return OPAQUE
+    return COLORKEY if surface.get_flags() & pygame.RLEACCELOK else FADING
+
+
+def set_alpha(surface: pygame.Surface, alpha: int) -> None:
+    # A surface alpha of 255 still blends every pixel, none copies them
+    surface.set_alpha(alpha if alpha < 255 else None)
+
+
+def register(name: str, kind: str, surfaces: typing.List[typing.Optional[pygame.Surface]]) -> None:
+    # The list is checked by report as it is then, so lists filled later (rotations) are registered once
+    registered[name] = kind, surfaces
+
+
+def get_slow_path(surface: pygame.Surface, kind: str) -> typing.Optional[str]:
+    flags = surface.get_flags()
+    if not is_display_format(surface):
+        return f'{surface.get_bitsize()} bit {surface.get_masks()} is converted on every blit'
+    if kind == ALPHA:
+        return None if is_per_pixel_alpha(surface) else 'no per-pixel alpha'
+    if flags & pygame.SRCALPHA:
+        return 'blended, it has an alpha channel or a surface alpha'
+    if kind == OPAQUE:
+        return None if surface.get_colorkey() is None else 'colorkey on an opaque image'
+    if surface.get_colorkey() is None:
+        return 'no colorkey'
+    if kind == COLORKEY and not flags & pygame.RLEACCELOK:
+        return 'colorkey without RLE'
+    return None
+
+
+def get_slow_paths() -> typing.List[typing.Tuple[str, str]]:
+    # First slow surface of every registered image, with the reason
+    slow_paths = []
+    for name, (kind, surfaces) in registered.items():
+        for surface in surfaces:
+            reason = get_slow_path(surface, kind) if surface is not None else None
+            if reason:
+                slow_paths.append((name, f'{kind}: {reason}'))
+                break
+    return slow_paths
+
+
+def report() -> None:
+    # Run when loading ends (see screens.Loading)
+    if config.surface_report:
+        for name, reason in get_slow_paths():
+            print(f'Slow blit path: {name} ({reason})', file=sys.stderr)
@@ -0,0 +1,170 @@
+import sys
+import json
+import time
+import heapq
+import typing
+import platform
+import managers
+import singletons
+import profiler
+import config
+
+# Upper bounds of the frame time histogram's buckets, in milliseconds, the last one takes the rest
+buckets = (4.0, 8.0, 12.0, 16.7, 20.0, 33.3, 50.0, 100.0, float('inf'))
+
+
+# Frame times of one game session, the work of a frame without the wait in clock.tick
+class Session:
+    def __init__(self, mode: int):
+        self.mode = mode
+        self.started = time.time()
+        self.frames = 0
+        self.histogram = [0] * len(buckets)
+        self.worst: typing.List[typing.Tuple[float, float, str]] = []  # Heap of (frame time, at second, phases)
+        self.phases: typing.Dict[str, typing.List[float]] = {}  # Phase -> [total, max, total in slow frames]
+        self.slow_frames = 0
+        self.peak_fruits = 0
+        self.peak_parts = 0
+        self.peak_particles = 0
+        self.spawned = 0  # Fruits spawned since the last frame
+        self.bursts: typing.List[typing.Tuple[float, int]] = []  # (At second, fruits spawned in one frame)
+
+    def add_frame(self, total: float, phases: typing.Dict[str, float]) -> None:
+        at = time.time() - self.started
+        work = total - phases.get('clock.tick', 0.0)
+        self.frames += 1
+        self.histogram[next(i for i, bound in enumerate(buckets) if work * 1000 < bound)] += 1
+        slow = work > config.frame_budget
+        self.slow_frames += slow
+        for phase, seconds in phases.items():
+            times = self.phases.setdefault(phase, [0.0, 0.0, 0.0])
+            times[0] += seconds
+            times[1] = max(times[1], seconds)
+            if slow:
+                times[2] += seconds
+        if len(self.worst) < config.telemetry_worst_frames or work > self.worst[0][0]:
+            frame = work, at, json.dumps({phase: round(seconds * 1000, 3) for phase, seconds in phases.items()})
+            if len(self.worst) < config.telemetry_worst_frames:
+                heapq.heappush(self.worst, frame)
+            else:
+                heapq.heapreplace(self.worst, frame)
+        fruits, parts, blades = singletons.FruitsGroup.group, singletons.PartsGroup.group, singletons.BladesGroup.group
+        self.peak_fruits = max(self.peak_fruits, len(fruits) if fruits is not None else 0)
+        self.peak_parts = max(self.peak_parts, len(parts) if parts is not None else 0)
+        if blades is not None:
+            self.peak_particles = max(
+                self.peak_particles, sum(blade.particle_system.get_count() for blade in blades)
+            )
+        if self.spawned >= config.telemetry_burst:
+            self.bursts.append((at, self.spawned))
+        self.spawned = 0
+
+    def save(self, score: int) -> None:
+        managers.DatabaseManager.get_instance().add_session({
+            'mode': self.mode,
+            'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+            'seconds': time.time() - self.started,
+            'frames': self.frames,
+            'slow_frames': self.slow_frames,
+            'score': score,
+            'machine': platform.node(),
+            'platform': platform.platform(),
+            'physics_engine': config.physics_engine,
+            'dirty_rendering': int(config.dirty_rendering),
+            'peak_fruits': self.peak_fruits,
+            'peak_parts': self.peak_parts,
+            'peak_particles': self.peak_particles,
+        }, [
+            (bound if bound != float('inf') else None, frames) for bound, frames in zip(buckets, self.histogram)
+        ], [
+            (phase, total * 1000, highest * 1000, slow * 1000) for phase, (total, highest, slow) in self.phases.items()
+        ], [
+            (at, work * 1000, phases) for work, at, phases in sorted(self.worst, reverse=True)
+        ], self.bursts)
+
+
+session: typing.Optional[Session] = None
+
+
+def start(mode: int) -> None:
+    global session
+    session = Session(mode) if config.session_telemetry else None
+
+
+def add_frame() -> None:
+    # The frame just finished by profiler.frames
+    if session is not None and profiler.frames.frames:
+        session.add_frame(*profiler.frames.frames[-1])
+
+
+def add_spawn(number: int = 1) -> None:
+    if session is not None:
+        session.spawned += number
+
+
+def stop(score: int) -> None:
+    global session
+    if session is not None:
+        stopped, session = session, None
+        stopped.save(score)
+
+
+def print_sessions(mode: typing.Optional[int] = None) -> None:
+    print(f'{"id":>5} {"started":19} {"mode":>4} {"seconds":>8} {"frames":>7} {"slow":>6} {"score":>6}  machine')
+    for row in managers.DatabaseManager.get_instance().get_sessions(mode):
+        print(
+            f'{row["id"]:5} {row["started"]:19} {row["mode"]:4} {row["seconds"]:8.1f} {row["frames"]:7} '
+            f'{row["slow_frames"]:6} {row["score"]:6}  {row["machine"]}'
+        )
+
+
+def print_session(session_id: int) -> None:
+    db = managers.DatabaseManager.get_instance()
+    row = db.get_session(session_id)
+    if row is None:
+        sys.exit(f'No session {session_id}')
+    for key in row.keys():
+        print(f'{key:16} {row[key]}')
+    print('frame time histogram:')
+    for bound, frames in db.get_session_histogram(session_id):
+        print(f'  < {bound if bound is not None else "inf":>6} ms {frames:7}')
+    print(f'phases, by their time in frames over {config.frame_budget * 1000:.1f} ms:')
+    for phase, total, highest, slow in db.get_session_phases(session_id):
+        print(f'  {phase:28} total {total:10.1f} ms  max {highest:7.2f} ms  in slow frames {slow:10.1f} ms')
+    print('worst frames:')
+    for at, work, phases in db.get_session_worst_frames(session_id):
+        print(f'  at {at:7.2f} s {work:7.2f} ms  {phases}')
+    print('spawn bursts:')
+    for at, fruits in db.get_session_bursts(session_id):
+        print(f'  at {at:7.2f} s {fruits} fruits')
+
+
+def print_diff(base_id: int, new_id: int) -> None:
+    db = managers.DatabaseManager.get_instance()
+    base, new = db.get_session(base_id), db.get_session(new_id)
+    if base is None or new is None:
+        sys.exit(f'No session {base_id if base is None else new_id}')
+    for key in ('seconds', 'frames', 'slow_frames', 'score', 'peak_fruits', 'peak_parts', 'peak_particles'):
+        print(f'{key:16} {base[key]:10.1f} -> {new[key]:10.1f}')
+    # Mean time per frame of every phase
+    base_phases = {phase: total / max(1, base['frames']) for phase, total, _, _ in db.get_session_phases(base_id)}
+    for phase, total, _, _ in db.get_session_phases(new_id):
+        mean = total / max(1, new['frames'])
+        print(f'  {phase:28} {base_phases.get(phase, 0.0):7.3f} -> {mean:7.3f} ms per frame')
+
+
+def main() -> None:
+    # python telemetry.py list [mode] | show <session id> | diff <base session id> <new session id>
+    command = sys.argv[1] if len(sys.argv) > 1 else 'list'
+    if command == 'list':
+        print_sessions(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    elif command == 'show':
+        print_session(int(sys.argv[2]))
+    elif command == 'diff':
+        print_diff(int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        sys.exit(f'Unknown command {command}')
+
+
+if __name__ == '__main__':
+    main()
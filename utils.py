@@ -1,10 +1,16 @@
 import sys
 import os
 import re
+import typing
+import functools
 import pygame
+import cache
+import surfaces
 import config
 
 screen = 0
+fonts: typing.Dict[typing.Tuple[str, int], pygame.font.Font] = {}
+images: typing.Dict[typing.Tuple[str, bool], pygame.Surface] = {}
 
 
 def init() -> pygame.Surface:
@@ -22,17 +28,53 @@ def terminate() -> None:
     sys.exit()
 
 
+def decode_image(name: str) -> pygame.Surface:
+    # Does not need the display, so it can run on a worker thread (see assets.Loader)
+    image = cache.load_image(name)
+    return image if image is not None else pygame.image.load(os.path.join('media/images', name))
+
+
+def add_image(name: str, image: pygame.Surface, convert: bool = True) -> pygame.Surface:
+    images[name, convert] = image.convert_alpha() if convert else image
+    return images[name, convert]
+
+
 def load_image(name: str, convert: bool = True) -> pygame.Surface:
-    init()  # Fix uninitialized display
-    image = pygame.image.load(os.path.join('media/images', name))
-    return image.convert_alpha() if convert else image
+    if (name, convert) not in images:
+        init()  # Fix uninitialized display
+        add_image(name, decode_image(name), convert)
+    return images[name, convert]
 
 
-def crop_image(image: pygame.Surface, rect: pygame.Rect) -> pygame.Surface:
+def crop_image(image: pygame.Surface, rect: pygame.Rect, kind: str = surfaces.COLORKEY) -> pygame.Surface:
     cropped = pygame.Surface(rect.size).convert()
     cropped.blit(image, (0, 0), rect)
-    cropped.set_colorkey((0, 0, 0))
-    return cropped
+    return surfaces.prepare(cropped, kind)
+
+
+def load_region(name: str, rect: pygame.Rect, convert: bool = True, kind: str = surfaces.COLORKEY) -> pygame.Surface:
+    # Taken from the packed atlas when the asset cache is built (see build_assets.py)
+    region = cache.get_region(name, rect, convert, kind)
+    return region if region is not None else crop_image(load_image(name, convert), rect, kind)
+
+
+def scale_image(image: pygame.Surface, size: typing.Tuple[int, int]) -> pygame.Surface:
+    # Images of the asset cache are already at the size they are used at
+    return image if image.get_size() == size else pygame.transform.scale(image, size)
+
+
+def get_font(size: int, path: str = config.game_font) -> pygame.font.Font:
+    key = path, size
+    if key not in fonts:
+        fonts[key] = pygame.font.Font(path, size)
+    return fonts[key]
+
+
+# Returned surfaces are shared between callers, copy them before changing alpha or pixels
+@functools.lru_cache(maxsize=config.text_cache_size)
+def render_text(text: str, size: int, color: tuple, antialias: bool = True,
+                path: str = config.game_font) -> pygame.Surface:
+    return get_font(size, path).render(text, antialias, color)
 
 
 first_cap_re = re.compile('(.)([A-Z][a-z]+)')
@@ -45,28 +87,23 @@ def to_snake_case(string: str) -> str:
 
 
 def create_pause_info(pos: tuple) -> tuple:
-    font = pygame.font.Font(config.game_font, 30)
-    text = font.render('Pause - Escape', 1, (200, 100, 10))
+    text = render_text('Pause - Escape', 30, (200, 100, 10))
     return text, pos
 
 
-pause_board_image = load_image(config.images['pause_board'])
-
-
 def create_pause_board() -> tuple:
-    board_pos = pause_board_image.get_rect(center=(config.width // 2, config.height // 2))
-    font = pygame.font.Font(config.game_font, 35)
-    text1 = font.render('Do you want to exit?', 1, (100, 150, 10))
+    board_pos = load_image(config.images['pause_board']).get_rect(center=(config.width // 2, config.height // 2))
+    text1 = render_text('Do you want to exit?', 35, (100, 150, 10))
     pos1 = text1.get_rect(center=(board_pos.centerx, board_pos.centery - 30))
-    text2 = font.render('Escape - No', 1, (100, 150, 10))
+    text2 = render_text('Escape - No', 35, (100, 150, 10))
     pos2 = text1.get_rect(center=(board_pos.centerx, board_pos.centery))
-    text3 = font.render('Left Alt - Yes', 1, (100, 150, 10))
+    text3 = render_text('Left Alt - Yes', 35, (100, 150, 10))
     pos3 = text1.get_rect(center=(board_pos.centerx, board_pos.centery + 30))
     return board_pos, text1, pos1, text2, pos2, text3, pos3
 
 
 def draw_pause_board(pause_data: list, surface: pygame.Surface) -> None:
-    surface.blit(pause_board_image, pause_data[0])
+    surface.blit(load_image(config.images['pause_board']), pause_data[0])
     surface.blit(pause_data[1], pause_data[2])
     surface.blit(pause_data[3], pause_data[4])
     surface.blit(pause_data[5], pause_data[6])